@@ -0,0 +1,57 @@
+from gurobipy import *
+from multiprocessing import Pool
+import numpy as np
+import resource
+import time
+from InventoryModel import *
+
+# Build time and peak memory of the glasses model with one addVar/addConstr per entry
+# (Inventory_Completed) against MVars and matrix constraints, on the 4 week model, the
+# 6 glass x 12 week practice data and random instances up to tens of thousands of products.
+# Every build runs in a fresh process, the peak is its resident memory above the start
+
+SIZES = [(100, 52), (1000, 52), (10000, 52), (20000, 104), (50000, 52)] # (products, weeks)
+LOOP_LIMIT = 520000 # Largest products x weeks built with the loops
+SEED = 0
+
+def instances():
+    # Inventory_Completed.py
+    yield '4 weeks', {'demand': np.array([[100, 50, 30, 400], [250, 20, 80, 35]], dtype=float),
+                      'initial': [25, 10], 'final': [100, 60], 'p': [15, 20], 's': [8, 12],
+                      'w': [2, 1.5], 'm': [5, 3], 'q': 20, 'K_w': 800, 'K_m': 1400, 'K_s': 6000}
+    yield 'glass_demand.csv', glassesInventory('../dat/glass_demand.csv')
+    for products, weeks in SIZES:
+        yield '{} x {}'.format(products, weeks), randomInventory(products, weeks, SEED)
+
+def residentMB():
+    return int(open('/proc/self/statm').read().split()[1]) * resource.getpagesize() / 2**20
+
+def measure(job):
+    # Build in this (fresh) process: seconds, peak MB and, for small models, the optimal cost
+    builder, data = job
+    build = buildInventoryLoop if builder == 'loop' else buildInventory
+    start = residentMB()
+    with Env(params={'OutputFlag': 0}) as env:
+        began = time.time()
+        model, x, I = build(**data, env=env)
+        seconds = time.time() - began
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 - start
+        objVal = float('nan')
+        if model.NumVars <= 2000:
+            model.optimize()
+            objVal = model.objVal
+        model.dispose()
+    return seconds, peak, objVal
+
+if __name__ == '__main__':
+    print('{:<18}{:>12}{:>12}{:>12}{:>12}{:>10}{:>14}'.format('Instance', 'Loop (s)', 'Loop (MB)', 'Matrix (s)', 'Matrix (MB)', 'Speedup', 'Cost'))
+    for name, data in instances():
+        demand = data['demand']
+        loop = (float('nan'),) * 3
+        with Pool(1, maxtasksperchild=1) as pool:
+            if demand.size <= LOOP_LIMIT:
+                loop = pool.apply(measure, (('loop', data),))
+            matrix = pool.apply(measure, (('matrix', data),))
+        if demand.size <= LOOP_LIMIT:
+            assert np.isnan(loop[2]) and np.isnan(matrix[2]) or abs(loop[2] - matrix[2]) < 1e-6
+        print('{:<18}{:>12.3f}{:>12.1f}{:>12.3f}{:>12.1f}{:>10.1f}{:>14.1f}'.format(name, loop[0], loop[1], matrix[0], matrix[1], loop[0] / matrix[0], matrix[2]))
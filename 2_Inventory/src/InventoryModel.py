@@ -0,0 +1,136 @@
+from gurobipy import *
+import numpy as np
+import scipy.sparse as sp
+
+
+def readDemand(inputfile):
+    # Demand csv like glass_demand.csv: a header "Week,1,2,..." and one row per glass.
+    # Returns the glasses, the weeks and the demand matrix (glasses x weeks)
+    f = open(inputfile, 'r')
+    Weeks = [int(week) for week in f.readline().split(',')[1:]]
+    Glasses = []
+    rows = []
+    for line in f:
+        fields = line.split(',')
+        Glasses.append(fields[0])
+        rows.append([float(value) for value in fields[1:]])
+    f.close()
+    return Glasses, Weeks, np.array(rows)
+
+def glassesInventory(inputfile):
+    # 2_PracticeQuestions: the glasses of glass_demand.csv with their production cost, storage cost,
+    # initial stock, final stock, worker time, machine time and storage space, and the capacities
+    # of the 4 week model
+    Glasses, pCost, sCost, iStock, fStock, workerTime, machineTime, storageSpace = multidict({
+        'V1': [100, 25, 50, 10, 3, 2, 4],
+        'V2': [80, 28, 20, 10, 3, 1, 5],
+        'V3': [110, 25, 0, 10, 3, 4, 5],
+        'V4': [90, 27, 15, 10, 2, 8, 6],
+        'V5': [200, 10, 0, 10, 4, 11, 4],
+        'V6': [140, 20, 10, 10, 4, 9, 9]
+    })
+    names, Weeks, demand = readDemand(inputfile)
+    return {'demand': demand, 'initial': [iStock[g] for g in names], 'final': [fStock[g] for g in names],
+            'p': [pCost[g] for g in names], 's': [sCost[g] for g in names],
+            'w': [workerTime[g] for g in names], 'm': [machineTime[g] for g in names],
+            'q': [storageSpace[g] for g in names], 'K_w': 800, 'K_m': 1400, 'K_s': 6000}
+
+def randomInventory(products, weeks, seed=0):
+    # Random instance in the shape of the glasses data: demand 0-40 per week, costs, times and
+    # space per product. Worker and machine capacity are 20% above the average weekly load of
+    # the demand, storage holds the space of one average week
+    rng = np.random.default_rng(seed)
+    demand = rng.integers(0, 41, size=(products, weeks)).astype(float)
+    data = {'demand': demand,
+            'initial': rng.integers(0, 51, size=products).astype(float),
+            'final': np.full(products, 10.0),
+            'p': rng.integers(80, 201, size=products).astype(float),
+            's': rng.integers(10, 31, size=products).astype(float),
+            'w': rng.integers(2, 5, size=products).astype(float),
+            'm': rng.integers(1, 12, size=products).astype(float),
+            'q': rng.integers(4, 10, size=products).astype(float)}
+    data['K_w'] = 1.2 * (data['w'] @ demand).mean()
+    data['K_m'] = 1.2 * (data['m'] @ demand).mean()
+    data['K_s'] = (data['q'] @ demand).mean()
+    return data
+
+def buildInventoryLoop(demand, initial, final, p, s, w, m, q, K_w, K_m, K_s, env=None):
+    # Inventory_Completed.py for any number of products and weeks: one addVar per
+    # variable and one addConstr per row, all named
+    model = Model('glasses_LP', env=env)
+    Glasses = range(len(demand))
+    Weeks = range(len(demand[0]))
+    q = np.broadcast_to(q, len(Glasses))
+
+    x = {}
+    I = {}
+    for i in Glasses:
+        for j in Weeks:
+            x[i,j] = model.addVar(vtype = GRB.CONTINUOUS, name = 'produce_{0}_{1}'.format(i,j))
+            I[i,j] = model.addVar(vtype = GRB.CONTINUOUS, name = 'store_{0}_{1}'.format(i,j))
+    model.update()
+
+    model.setObjective(quicksum(p[i]*x[i,j] + s[i]*I[i,j] for i in Glasses for j in Weeks), GRB.MINIMIZE)
+
+    for j in Weeks:
+        model.addConstr( quicksum(w[i]*x[i,j] for i in Glasses) <= K_w, name='personnel_{}'.format(j))
+        model.addConstr( quicksum(m[i]*x[i,j] for i in Glasses) <= K_m, name='machine_{}'.format(j))
+        model.addConstr( quicksum(q[i]*I[i,j] for i in Glasses) <= K_s, name='storage_{}'.format(j))
+
+    for i in Glasses:
+        for j in Weeks:
+            if j == 0:
+                model.addConstr(I[i,j] == initial[i] + x[i,j] - demand[i][j], name='stock_{0}_{1}'.format(i,j))
+            else:
+                model.addConstr(I[i,j] == I[i,j-1] + x[i,j] - demand[i][j], name='stock_{0}_{1}'.format(i,j))
+
+    for i in Glasses:
+        model.addConstr( I[i, Weeks[-1]] == final[i], name = 'final_inv_{}'.format(i))
+    model.update()
+    return model, x, I
+
+def buildInventory(demand, initial, final, p, s, w, m, q, K_w, K_m, K_s, names=False, env=None):
+    # Same model from a products x weeks demand matrix. The variables are one MVar, x then I,
+    # entry (i, j) at i * weeks + j, and every family of rows is one sparse matrix constraint.
+    # Names ('produce[k]', 'stock[k]', ...) cost a string per variable and row, so they are
+    # only set with names=True. x and I are returned as products x weeks views
+    demand = np.asarray(demand, dtype=float)
+    products, weeks = demand.shape
+    n = products * weeks
+    initial, final, p, s, w, m = (np.asarray(a, dtype=float) for a in (initial, final, p, s, w, m))
+    q = np.broadcast_to(np.asarray(q, dtype=float), products)
+    label = (lambda name: name) if names else (lambda name: '')
+
+    model = Model('glasses_LP', env=env)
+    x = model.addMVar(n, obj=np.repeat(p, weeks), name=label('produce'))
+    I = model.addMVar(n, obj=np.repeat(s, weeks), name=label('store'))
+    model.modelSense = GRB.MINIMIZE
+
+    # Weekly capacities: row j sums over the entries (i, j) of all products
+    week = sp.eye(weeks, format='csr')
+    model.addMConstr(sp.kron(w[None, :], week, format='csr'), x, '<', np.full(weeks, K_w), name=label('personnel'))
+    model.addMConstr(sp.kron(m[None, :], week, format='csr'), x, '<', np.full(weeks, K_m), name=label('machine'))
+    model.addMConstr(sp.kron(q[None, :], week, format='csr'), I, '<', np.full(weeks, K_s), name=label('storage'))
+
+    # Stock balance I[i,j] - I[i,j-1] - x[i,j] = -demand[i,j], with initial[i] in place of I[i,-1].
+    # The columns are all variables of the model, x then I
+    identity = sp.eye(n, format='csr')
+    previous = sp.kron(sp.eye(products), sp.eye(weeks, k=-1), format='csr')
+    rhs = -demand.copy()
+    rhs[:, 0] += initial
+    model.addMConstr(sp.hstack([-identity, identity - previous], format='csr'), None, '=', rhs.ravel(), name=label('stock'))
+
+    last = sp.csr_matrix((np.ones(products), (np.arange(products), np.arange(products) * weeks + weeks - 1)), shape=(products, n))
+    model.addMConstr(last, I, '=', final, name=label('final_inv'))
+    model.update()
+    model._x = x.reshape(products, weeks)
+    model._I = I.reshape(products, weeks)
+    return model, model._x, model._I
+
+def printPlan(model, x, I, Glasses=None):
+    print("Objective Value: {}".format(model.objVal))
+    X, S = x.X, I.X
+    Glasses = Glasses if Glasses is not None else range(X.shape[0])
+    for j in range(X.shape[1]):
+        print("Week {}: Produce {}".format(j+1, ' '.join('{:g} {}'.format(X[i,j], g) for i, g in enumerate(Glasses))))
+        print("Week {}: Store   {}".format(j+1, ' '.join('{:g} {}'.format(S[i,j], g) for i, g in enumerate(Glasses))))
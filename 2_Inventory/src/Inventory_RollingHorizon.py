@@ -0,0 +1,28 @@
+from gurobipy import *
+import numpy as np
+from InventoryModel import *
+from RollingHorizon import *
+
+WINDOW = 4 # Weeks planned together on the glass_demand.csv data
+STEP = 1 # Weeks fixed after each window
+PRODUCTS, WEEKS = 6, 104 # Random instance, its monolithic model fits the restricted license
+WINDOWS = [4, 8, 13, 26] # Window lengths tried on the random instance, each with step 1 and step = window
+SEED = 0
+
+data = glassesInventory('../dat/glass_demand.csv')
+compareRollingHorizon(data, WINDOW, STEP)
+
+print()
+data = randomInventory(PRODUCTS, WEEKS, SEED)
+print('{:>8}{:>6}{:>10}{:>12}{:>12}{:>12}{:>14}{:>10}{:>14}{:>14}'.format('Window', 'Step', 'Solves', 'Mean (s)', 'Max (s)', 'Total (s)', 'Cost', 'Backlog',
+                                                                      'Monolithic', 'Degradation'))
+for window in WINDOWS:
+    for step in sorted({1, window}):
+        windows, rollingCost, backlog, rollingTime, monolithicCost, monolithicTime = compareRollingHorizon(data, window, step, verbose=False)
+        if windows is None:
+            print('{:>8}{:>6}{:>12}'.format(window, step, 'infeasible'))
+            continue
+        seconds = np.array([row[2] for row in windows])
+        print('{:>8}{:>6}{:>10}{:>12.4f}{:>12.4f}{:>12.3f}{:>14.1f}{:>10.1f}{:>14.1f}{:>13.2f}%'.format(window, step, len(windows), seconds.mean(), seconds.max(),
+                                                                                               rollingTime, rollingCost, backlog, monolithicCost,
+                                                                                               degradation(rollingCost, monolithicCost)))
@@ -0,0 +1,166 @@
+from gurobipy import *
+from collections import deque
+import numpy as np
+import scipy.sparse as sp
+import time
+from InventoryModel import *
+
+
+class Week:
+    # Variables and rows of one week of the window
+    def __init__(self, j, x, I, B, short, capacity, balance, reserve, final=None):
+        self.j = j
+        self.x = x
+        self.I = I
+        self.B = B
+        self.short = short
+        self.capacity = capacity
+        self.balance = balance
+        self.reserve = reserve
+        self.final = final
+
+
+class RollingHorizon:
+    # Plans the weeks of an inventory instance (the arguments of buildInventory as a dict) in
+    # overlapping windows of `window` weeks: solve the window, fix its first `step` weeks and move
+    # on. One model is kept the whole time. Fixed weeks are removed from it, the stock they leave
+    # becomes the right hand side of the balance rows of the new first week, and only the weeks
+    # entering the window get new variables and rows. Gurobi warm starts every window from the
+    # basis of the one before. The final stock is required once the last week is in the window.
+    #
+    # A window only sees its own weeks, so on its own it would run the stock down and leave later
+    # windows short of capacity. So every week has a reserve row: the personnel and machine time of
+    # the demand after the week that its capacity cannot cover (worked back from the final stock)
+    # should be in stock, in products that are still needed. Demand that still cannot be met is
+    # backlogged at `penalty` per unit and week (default 10 times the highest production plus
+    # storage cost) instead of making the window infeasible
+
+    def __init__(self, data, window, step=1, env=None, penalty=None):
+        if not 1 <= step <= window:
+            raise ValueError("The step must be between 1 and the window length, got step {} for window {}".format(step, window))
+        self.demand = np.asarray(data['demand'], dtype=float)
+        self.products, self.weeks = self.demand.shape
+        self.initial, self.final, self.p, self.s, self.w, self.m = (np.asarray(data[key], dtype=float) for key in ('initial', 'final', 'p', 's', 'w', 'm'))
+        self.q = np.broadcast_to(np.asarray(data['q'], dtype=float), self.products)
+        self.capacities = np.array([data['K_w'], data['K_m'], data['K_s']], dtype=float)
+        self.window = window
+        self.step = step
+        self.penalty = penalty if penalty is not None else 10 * (self.p + self.s).max()
+        # reserve[:, j] >= time[:, j+1] @ demand - capacity + reserve[:, j+1], for personnel and machine
+        self.time = np.array([self.w, self.m])
+        load = self.time @ self.demand
+        self.reserve = np.zeros((2, self.weeks))
+        self.reserve[:, -1] = self.time @ self.final
+        for j in range(self.weeks - 2, -1, -1):
+            self.reserve[:, j] = np.maximum(self.reserve[:, j + 1] + load[:, j + 1] - self.capacities[:2], 0)
+        # Stock beyond the later demand and the final stock is never used, it bounds I so the reserve is
+        # met with stock the later weeks need
+        self.useful = self.demand[:, ::-1].cumsum(axis=1)[:, ::-1] - self.demand + self.final[:, None]
+        self.model = Model('glasses_rolling', env=env)
+        self.model.setParam('OutputFlag', 0)
+        self.model.modelSense = GRB.MINIMIZE
+        self.open = deque() # Weeks in the window
+        self.carried = self.initial # Stock less backlog at the end of the last fixed week
+        self.X = np.zeros((self.products, self.weeks))
+        self.I = np.zeros((self.products, self.weeks))
+        self.B = np.zeros((self.products, self.weeks))
+
+    def addWeek(self, j):
+        P = self.products
+        x = self.model.addMVar(P, obj=self.p, name='produce_{}'.format(j))
+        I = self.model.addMVar(P, ub=self.useful[:, j], obj=self.s, name='store_{}'.format(j))
+        B = self.model.addMVar(P, obj=np.full(P, self.penalty), name='backlog_{}'.format(j))
+        # Personnel and machine time of x, storage space of I
+        usage = sp.csr_matrix(np.block([[self.w, np.zeros(P)], [self.m, np.zeros(P)], [np.zeros(P), self.q]]))
+        capacity = self.model.addMConstr(usage, hstack((x, I)), '<', self.capacities, name='capacity_{}'.format(j))
+        # (I - B)[:,j] - x[:,j] - (I - B)[:,j-1] = -demand[:,j], the first week of the window has the carried stock on the right
+        identity = sp.eye(P, format='csr')
+        if self.open:
+            balance = self.model.addMConstr(sp.hstack([-identity, identity, -identity, -identity, identity], format='csr'),
+                                            hstack((x, I, B, self.open[-1].I, self.open[-1].B)), '=', -self.demand[:, j], name='stock_{}'.format(j))
+        else:
+            balance = self.model.addMConstr(sp.hstack([-identity, identity, -identity], format='csr'), hstack((x, I, B)),
+                                            '=', self.carried - self.demand[:, j], name='stock_{}'.format(j))
+        # time @ I[:,j] + short[:,j] >= reserve[:,j], the shortfall is priced like the backlog since the stock an earlier
+        # window left may not fit the reserve and storage together
+        short = self.model.addMVar(2, obj=np.full(2, self.penalty), name='short_{}'.format(j))
+        reserve = self.model.addMConstr(sp.hstack([self.time, sp.eye(2)], format='csr'), hstack((I, short)),
+                                        '>', self.reserve[:, j], name='reserve_{}'.format(j))
+        final = None
+        if j == self.weeks - 1:
+            final = self.model.addMConstr(identity, I, '=', self.final, name='final_inv')
+        self.open.append(Week(j, x, I, B, short, capacity, balance, reserve, final))
+
+    def fixWeek(self):
+        # Keeps the plan of the first week of the window and takes the week out of the model
+        week = self.open.popleft()
+        self.X[:, week.j] = week.x.X
+        self.I[:, week.j] = week.I.X
+        self.B[:, week.j] = week.B.X
+        self.carried = self.I[:, week.j] - self.B[:, week.j]
+        for item in (week.x, week.I, week.B, week.short, week.capacity, week.balance, week.reserve, week.final):
+            if item is not None:
+                self.model.remove(item)
+        if self.open:
+            # Its stock variables are gone from the next balance rows, the stock is a constant now
+            self.open[0].balance.RHS = self.carried - self.demand[:, self.open[0].j]
+
+    def solve(self, verbose=True):
+        # Returns one row per window: (first week, last week, seconds, window cost). With the backlog a window is
+        # only infeasible if the initial or the final stock cannot be stored, then there is no plan and it returns None
+        windows = []
+        first, end = 0, 0
+        while first < self.weeks:
+            while end < min(first + self.window, self.weeks):
+                self.addWeek(end)
+                end += 1
+            start = time.time()
+            self.model.optimize()
+            seconds = time.time() - start
+            if self.model.status != GRB.OPTIMAL:
+                if verbose:
+                    print('Weeks {}-{}: no feasible plan'.format(first + 1, end))
+                return None
+            windows.append((first + 1, end, seconds, self.model.objVal))
+            if verbose:
+                print('Weeks {}-{}: {:.4f} s, cost {:.1f}'.format(first + 1, end, seconds, self.model.objVal))
+            fixed = min(self.step, end - first) if end < self.weeks else end - first
+            for k in range(fixed):
+                self.fixWeek()
+            first += fixed
+        return windows
+
+    def cost(self):
+        # Production, storage and backlog cost of the fixed plan
+        return float(self.p @ self.X.sum(axis=1) + self.s @ self.I.sum(axis=1) + self.penalty * self.B.sum())
+
+    def backlog(self):
+        # Units short summed over the weeks, 0 if the plan meets all demand
+        return float(self.B.sum())
+
+
+def degradation(rollingCost, monolithicCost):
+    # Extra cost of the rolling plan in percent. Below 0 beyond rounding means the rolling plan
+    # broke the model (carried stock, final stock), so the sign is kept
+    return 100 * (rollingCost - monolithicCost) / monolithicCost
+
+def compareRollingHorizon(data, window, step=1, env=None, verbose=True):
+    # Rolling horizon plan against the monolithic model over all weeks. Returns the windows, the
+    # rolling cost, backlog and time, and the monolithic cost and time
+    start = time.time()
+    planner = RollingHorizon(data, window, step, env)
+    windows = planner.solve(verbose)
+    rollingTime = time.time() - start
+    rollingCost = planner.cost() if windows is not None else float('nan')
+    backlog = planner.backlog() if windows is not None else float('nan')
+
+    start = time.time()
+    model, x, I = buildInventory(**data, env=env)
+    model.setParam('OutputFlag', 0)
+    model.optimize()
+    monolithicTime = time.time() - start
+    monolithicCost = model.objVal if model.status == GRB.OPTIMAL else float('nan')
+    if verbose:
+        print('Rolling horizon: {:.1f} in {:.3f} s, backlog {:g}, monolithic: {:.1f} in {:.3f} s, degradation {:.2f}%'.format(
+            rollingCost, rollingTime, backlog, monolithicCost, monolithicTime, degradation(rollingCost, monolithicCost)))
+    return windows, rollingCost, backlog, rollingTime, monolithicCost, monolithicTime
@@ -0,0 +1,177 @@
+from gurobipy import *
+import math
+import numpy as np
+import time
+from NetworkFlow import *
+from Scenarios import *
+from MaxFlow import *
+from ShortestPath import *
+
+# Build time of the min cost flow model: one Arcs.select per node and one addVar per
+# arc (WasteManagement_Complete) against the incidence matrix with addMVar/addMConstr,
+# then solve time of Gurobi against the network simplex, then warm started scenario
+# re-solves against solves from scratch, the maximum flow LP against push-relabel, and
+# last the unit flow LP against the heap shortest path trees for many s-t queries
+
+SIZES = [(100, 1000), (1000, 10000), (2000, 20000), (10000, 100000), (100000, 1000000), (200000, 2000000)] # (nodes, arcs)
+LOOP_LIMIT = 1000000 # Largest number of arcs built with the select loop
+SOLVE_SIZES = [(200, 1900), (2000, 20000), (20000, 200000)] # (nodes, arcs)
+SCENARIOS = 50 # Random bound, cost and supply changes on the smallest solve size
+MAXFLOW_SIZES = [(200, 1900), (2000, 20000), (20000, 200000), (200000, 2000000)] # (nodes, arcs)
+QUERIES = 5000 # Random s-t pairs from 50 sources on each shortest path size
+LP_QUERIES = 50 # Of those, solved as unit flow LPs on the smallest size
+SP_SIZES = [(200, 1900), (2000, 20000), (20000, 200000)] # (nodes, arcs)
+SEED = 0
+
+def randomNetwork(n, m, seed=0):
+    # Random arcs with costs 1-100, a tenth of the nodes supply 10 each and another tenth demand 10
+    rng = np.random.default_rng(seed)
+    pairs = np.unique(rng.integers(0, n, size=(2 * m, 2)), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    pairs = pairs[rng.permutation(len(pairs))[:m]]
+    Nodes = list(range(n))
+    Supply = dict.fromkeys(Nodes, 0)
+    for v in range(n // 10):
+        Supply[v] = 10
+        Supply[n - 1 - v] = -10
+    data = {(i, j): [c, 0, 1000] for (i, j), c in zip(pairs.tolist(), rng.integers(1, 101, size=len(pairs)).tolist())}
+    Arcs, cost, lb, ub = multidict(data)
+    return Nodes, tuplelist(Arcs), Supply, cost, lb, ub
+
+def buildMinCostFlowLoop(Nodes, Arcs, Supply, cost, lb, ub):
+    model = Model('minCost')
+
+    x = {}
+    for i, j in Arcs:
+        x[i, j] = model.addVar(vtype=GRB.CONTINUOUS, lb = lb[i,j], ub = ub[i,j], obj = cost[i,j])
+
+    model.modelSense = GRB.MINIMIZE
+    model.update()
+
+    for v in Nodes:
+        model.addConstr(quicksum(x[i,j] for i, j in Arcs.select(v, '*'))-
+            quicksum(x[j, i] for j, i in Arcs.select('*', v)) == Supply[v], name="node %s" %v)
+    model.update()
+    return model, x
+
+print('{:>10}{:>10}{:>12}{:>12}{:>10}'.format('Nodes', 'Arcs', 'Loop (s)', 'Matrix (s)', 'Speedup'))
+for n, m in SIZES:
+    network = randomNetwork(n, m, SEED)
+    loopTime = float('nan')
+    if m <= LOOP_LIMIT:
+        start = time.time()
+        loop, x = buildMinCostFlowLoop(*network)
+        loopTime = time.time() - start
+    start = time.time()
+    model, x = buildMinCostFlow(*network)
+    model.update()
+    matrixTime = time.time() - start
+    if m <= LOOP_LIMIT and m <= 1000:
+        # Small enough to solve: both models give the same cost
+        loop.setParam('OutputFlag', 0)
+        model.setParam('OutputFlag', 0)
+        loop.optimize()
+        model.optimize()
+        assert abs(loop.objVal - model.objVal) < 1e-6
+    print('{:>10}{:>10}{:>12.3f}{:>12.3f}{:>10.1f}'.format(n, m, loopTime, matrixTime, loopTime / matrixTime))
+
+print()
+print('{:>10}{:>10}{:>12}{:>12}{:>14}{:>10}'.format('Nodes', 'Arcs', 'Gurobi (s)', 'Simplex (s)', 'Cost', 'Pivots'))
+for n, m in SOLVE_SIZES:
+    network = randomNetwork(n, m, SEED)
+    gurobiTime = float('nan')
+    if m < 2000:
+        # Larger models need a full Gurobi license
+        start = time.time()
+        objVal, flow = minCostFlow(*network, method='gurobi', verbose=False)
+        gurobiTime = time.time() - start
+    start = time.time()
+    solver = networkSimplex(*network)
+    simplexTime = time.time() - start
+    if m < 2000:
+        assert abs(objVal - solver.objVal) < 1e-6
+    print('{:>10}{:>10}{:>12.3f}{:>12.3f}{:>14.1f}{:>10}'.format(n, m, gurobiTime, simplexTime, solver.objVal, solver.pivots))
+
+def randomScenarios(network, k, seed=0):
+    # Each scenario tightens the bounds of 20 arcs, changes 20 costs or moves 5 units of supply
+    Nodes, Arcs, Supply, cost, lb, ub = network
+    rng = np.random.default_rng(seed)
+    scenarios = []
+    for s in range(k):
+        arcs = [Arcs[a] for a in rng.choice(len(Arcs), size=20, replace=False)]
+        if s % 3 == 0:
+            scenarios.append(('bounds {}'.format(s), {'ub': {a: int(rng.integers(5, 20)) for a in arcs}}))
+        elif s % 3 == 1:
+            scenarios.append(('costs {}'.format(s), {'cost': {a: int(rng.integers(1, 101)) for a in arcs}}))
+        else:
+            i, j = rng.choice(len(Nodes) // 10, size=2, replace=False).tolist()
+            scenarios.append(('supply {}'.format(s), {'supply': {i: Supply[i] - 5, j: Supply[j] + 5}}))
+    return scenarios
+
+print()
+network = randomNetwork(*SOLVE_SIZES[0], seed=SEED)
+scenarios = randomScenarios(network, SCENARIOS, SEED)
+print('{:<8}{:>12}{:>12}'.format('Start', 'Iterations', 'Time (s)'))
+costs = []
+for warm in [False, True]:
+    start = time.time()
+    rows = solveScenarios(network, scenarios, warm)
+    costs.append([row[2] for row in rows])
+    print('{:<8}{:>12}{:>12.3f}'.format('warm' if warm else 'cold', sum(row[3] for row in rows), time.time() - start))
+assert np.allclose(costs[0], costs[1], equal_nan=True)
+
+print()
+print('{:>10}{:>10}{:>12}{:>12}{:>12}{:>10}'.format('Nodes', 'Arcs', 'LP (s)', 'Push (s)', 'Max Flow', 'Cut'))
+for n, m in MAXFLOW_SIZES:
+    Nodes, Arcs, Supply, cost, lb, ub = randomNetwork(n, m, SEED)
+    lpTime = float('nan')
+    if m < 2000:
+        start = time.time()
+        lpValue, lpFlow, lpCut = maxFlowLP(Nodes, Arcs, ub, lb, 0, n - 1)
+        lpTime = time.time() - start
+    start = time.time()
+    value, flow, (S, T) = maxFlow(Nodes, Arcs, ub, lb, 0, n - 1)
+    pushTime = time.time() - start
+    if m < 2000:
+        assert abs(lpValue - value) < 1e-6
+    side = set(S)
+    cut = sum(ub[i, j] for i, j in Arcs if i in side and j not in side)
+    assert abs(cut - value) < 1e-6
+    print('{:>10}{:>10}{:>12.3f}{:>12.3f}{:>12.1f}{:>10.1f}'.format(n, m, lpTime, pushTime, value, cut))
+
+# Lower bounds that force every arc out of the sink to capacity: the flow they send has to end
+# at the source, so the maximum net flow from source to sink is negative
+n, m = MAXFLOW_SIZES[0]
+Nodes, Arcs, Supply, cost, lb, ub = randomNetwork(n, m, SEED)
+lb = dict(lb)
+for i, j in Arcs.select(n - 1, '*'):
+    lb[i, j] = ub[i, j]
+lpValue, lpFlow, lpCut = maxFlowLP(Nodes, Arcs, ub, lb, 0, n - 1)
+value, flow, (S, T) = maxFlow(Nodes, Arcs, ub, lb, 0, n - 1)
+side = set(S)
+cut = sum(ub[i, j] for i, j in Arcs if i in side and j not in side) - sum(lb[i, j] for i, j in Arcs if j in side and i not in side)
+assert value < 0 and abs(lpValue - value) < 1e-6 and abs(cut - value) < 1e-6
+print('{:>10}{:>10}{:>12}{:>12}{:>12.1f}{:>10.1f}'.format(n, m, 'lower', 'bounds', value, cut))
+
+print()
+print('{:>10}{:>10}{:>10}{:>14}{:>12}{:>12}'.format('Nodes', 'Arcs', 'Queries', 'LP/query (s)', 'Trees (s)', 'Cached (s)'))
+for n, m in SP_SIZES:
+    Nodes, Arcs, Supply, cost, lb, ub = randomNetwork(n, m, SEED)
+    rng = np.random.default_rng(SEED)
+    pairs = list(zip(rng.integers(0, 50, QUERIES).tolist(), rng.integers(0, n, QUERIES).tolist()))
+    lpTime = float('nan')
+    if m < 2000:
+        start = time.time()
+        lengths = [shortestPathLP(Nodes, Arcs, cost, s, t) for s, t in pairs[:LP_QUERIES]]
+        lpTime = (time.time() - start) / LP_QUERIES
+    start = time.time()
+    paths = ShortestPaths(Nodes, Arcs, cost)
+    distance = paths.query(pairs)
+    treeTime = time.time() - start
+    start = time.time()
+    distance = paths.query(pairs) # Every tree is memoized now
+    cachedTime = time.time() - start
+    if m < 2000:
+        for pair, result in zip(pairs, lengths):
+            assert (result is None and distance[pair] == math.inf) or abs(result[0] - distance[pair]) < 1e-6
+    print('{:>10}{:>10}{:>10}{:>14.4f}{:>12.3f}{:>12.4f}'.format(n, m, QUERIES, lpTime, treeTime, cachedTime))
@@ -0,0 +1,202 @@
+from gurobipy import *
+from collections import deque
+import numpy as np
+from NetworkFlow import *
+
+
+class PushRelabel:
+    # Highest-label push-relabel on a residual graph in arrays: arc k of the input is
+    # residual edge 2k (tail -> head) and its reverse is 2k+1, the edges leaving a node
+    # are adj[first[u]:first[u+1]]. Exact labels come from a backward breadth-first search
+    # (global relabeling, also every n relabels), and the gap heuristic lifts every node
+    # above an empty label to n, where it stops taking part
+
+    def __init__(self, n, tail, head, cap):
+        tail = np.asarray(tail, dtype=np.int64)
+        head = np.asarray(head, dtype=np.int64)
+        frm = np.empty(2 * len(tail), dtype=np.int64)
+        to = np.empty(2 * len(tail), dtype=np.int64)
+        frm[0::2], frm[1::2] = tail, head
+        to[0::2], to[1::2] = head, tail
+        res = np.zeros(2 * len(tail))
+        res[0::2] = cap
+        order = np.argsort(frm, kind='stable')
+        self.n = n
+        self.adj = order.tolist()
+        self.first = np.searchsorted(frm[order], np.arange(n + 1)).tolist()
+        self.to = to.tolist()
+        self.res = res.tolist()
+        self.excess = [0.0] * n
+
+    def labels(self, sink, blocked):
+        # Residual distance to sink, n for blocked nodes and nodes that cannot reach it
+        n, adj, first, to, res = self.n, self.adj, self.first, self.to, self.res
+        label = [n] * n
+        label[sink] = 0
+        queue = deque([sink])
+        while queue:
+            v = queue.popleft()
+            for k in range(first[v], first[v + 1]):
+                e = adj[k]
+                w = to[e]
+                if label[w] == n and res[e ^ 1] > 0 and w not in blocked:
+                    label[w] = label[v] + 1
+                    queue.append(w)
+        return label
+
+    def discharge(self, sink, blocked):
+        # Push the excess of every node other than sink and blocked towards sink, as far as it goes
+        n, adj, first, to, res, excess = self.n, self.adj, self.first, self.to, self.res, self.excess
+        relabels = n # Forces a global relabel first
+        while True:
+            if relabels >= n:
+                label = self.labels(sink, blocked)
+                count = [0] * (n + 1)
+                for v in range(n):
+                    count[label[v]] += 1
+                buckets = [[] for b in range(n)]
+                for v in range(n):
+                    if excess[v] > 0 and label[v] < n and v != sink and v not in blocked:
+                        buckets[label[v]].append(v)
+                current = first[:-1]
+                b = n - 1
+                relabels = 0
+            while b >= 0 and not buckets[b]:
+                b -= 1
+            if b < 0:
+                return
+            u = buckets[b].pop()
+            if label[u] != b or excess[u] <= 0:
+                continue
+            while excess[u] > 0:
+                if current[u] == first[u + 1]:
+                    # Relabel
+                    old = label[u]
+                    new = n
+                    for k in range(first[u], first[u + 1]):
+                        e = adj[k]
+                        if res[e] > 0 and label[to[e]] + 1 < new:
+                            new = label[to[e]] + 1
+                    count[old] -= 1
+                    relabels += 1
+                    if count[old] == 0:
+                        # Gap: nothing above old can reach sink any more
+                        for v in range(n):
+                            if old < label[v] < n:
+                                count[label[v]] -= 1
+                                label[v] = n
+                                count[n] += 1
+                        new = n
+                    label[u] = new
+                    count[new] += 1
+                    current[u] = first[u]
+                    if new >= n:
+                        break
+                    continue
+                e = adj[current[u]]
+                v = to[e]
+                if res[e] > 0 and label[u] == label[v] + 1:
+                    d = excess[u] if excess[u] < res[e] else res[e]
+                    res[e] -= d
+                    res[e ^ 1] += d
+                    excess[u] -= d
+                    if excess[v] <= 0 and v != sink and v not in blocked:
+                        buckets[label[v]].append(v)
+                        if label[v] > b:
+                            b = label[v]
+                    excess[v] += d
+                else:
+                    current[u] += 1
+
+    def maxFlow(self, s, t):
+        # Adds a maximum s-t flow to the current residual graph, returns its value
+        start = self.excess[t]
+        for k in range(self.first[s], self.first[s + 1]):
+            e = self.adj[k]
+            if self.res[e] > 0:
+                d = self.res[e]
+                self.res[e] = 0
+                self.res[e ^ 1] += d
+                self.excess[self.to[e]] += d
+                self.excess[s] -= d
+        self.discharge(t, {s})
+        # The preflow is maximal, the excess that cannot reach t goes back to s
+        self.discharge(s, {t})
+        return self.excess[t] - start
+
+    def reaching(self, t):
+        # Nodes that can still reach t in the residual graph, the sink side of a minimum cut
+        label = self.labels(t, set())
+        return {v for v in range(self.n) if label[v] < self.n}
+
+    def flow(self, m):
+        # Flow of the input arcs 0..m-1 (residual capacity of the reverse edges)
+        return np.array(self.res[1:2 * m:2])
+
+
+def maxFlow(Nodes, Arcs, ub, lb=None, source='s', sink='t'):
+    # Maximum source-sink flow with lb <= x <= ub. Returns the value, the flow of every arc
+    # and the minimum cut (S, T), or None if no flow meets the lower bounds
+    n, m = len(Nodes), len(Arcs)
+    tail, head = arcArrays(Nodes, Arcs)
+    upper = arcValues(Arcs, ub)
+    lower = arcValues(Arcs, lb) if lb is not None else np.zeros(m)
+    index = {v: k for k, v in enumerate(Nodes)}
+    s, t = index[source], index[sink]
+    big = np.where(upper < 1e30, upper, 0).sum() + lower.sum() + 1 # Stands in for infinite capacities
+    upper = np.minimum(upper, big)
+    if np.any(lower > upper):
+        return None
+
+    if not lower.any():
+        engine = PushRelabel(n, tail, head, upper)
+        value = engine.maxFlow(s, t)
+        flow = engine.flow(m)
+    else:
+        # Flow y = x - lb through the arcs with capacity ub - lb, arcs t -> s and s -> t (the net
+        # flow from s to t may have either sign) and, for the imbalance of the lower bounds, arcs
+        # from a super source and to a super sink
+        imbalance = np.zeros(n)
+        np.add.at(imbalance, head, lower)
+        np.subtract.at(imbalance, tail, lower)
+        S, T = n, n + 1
+        into = np.nonzero(imbalance > 0)[0]
+        outof = np.nonzero(imbalance < 0)[0]
+        engine = PushRelabel(n + 2, np.concatenate([tail, [t, s], np.full(len(into), S), outof]),
+                             np.concatenate([head, [s, t], into, np.full(len(outof), T)]),
+                             np.concatenate([upper - lower, [big, big], imbalance[into], -imbalance[outof]]))
+        if engine.maxFlow(S, T) < imbalance[into].sum() - 1e-9:
+            return None
+        # The net flow on t -> s less s -> t is the value of a feasible s-t flow, take both arcs
+        # and the super arcs out
+        value = engine.res[2 * m + 1] - engine.res[2 * m + 3]
+        for k in range(m, m + 2 + len(into) + len(outof)):
+            engine.res[2 * k] = engine.res[2 * k + 1] = 0
+        value += engine.maxFlow(s, t)
+        flow = engine.flow(m) + lower
+    sinkSide = engine.reaching(t)
+    cut = ([v for k, v in enumerate(Nodes) if k not in sinkSide], [v for k, v in enumerate(Nodes) if k in sinkSide])
+    return value, dict(zip(Arcs, flow.tolist())), cut
+
+def maxFlowLP(Nodes, Arcs, ub, lb=None, source='s', sink='t', env=None):
+    # The LP formulation: maximize the net flow out of source, flow balance at all other nodes but sink
+    m = len(Arcs)
+    tail, head = arcArrays(Nodes, Arcs)
+    index = {v: k for k, v in enumerate(Nodes)}
+    A = incidenceMatrix(len(Nodes), tail, head)
+    model = Model('maxFlow', env=env)
+    model.setParam('OutputFlag', 0)
+    x = model.addMVar(m, lb=arcValues(Arcs, lb) if lb is not None else 0, ub=arcValues(Arcs, ub), name='x')
+    model.setObjective(A[index[source]] @ x, GRB.MAXIMIZE)
+    rows = [k for k in range(len(Nodes)) if k != index[source] and k != index[sink]]
+    balance = model.addMConstr(A[rows], x, '=', np.zeros(len(rows)), name='node')
+    model.optimize()
+    if model.status != GRB.OPTIMAL:
+        return None
+    # Min cut from the duals: the balance rows are priced -1 on the source side and 0 on
+    # the sink side
+    pi = np.zeros(len(Nodes))
+    pi[rows] = -balance.Pi
+    pi[index[source]] = 1
+    cut = ([v for k, v in enumerate(Nodes) if pi[k] > 0.5], [v for k, v in enumerate(Nodes) if pi[k] <= 0.5])
+    return model.objVal, dict(zip(Arcs, x.X.tolist())), cut
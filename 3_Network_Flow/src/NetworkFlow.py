@@ -0,0 +1,74 @@
+from gurobipy import *
+import numpy as np
+import scipy.sparse as sp
+from NetworkSimplex import *
+
+
+def arcArrays(Nodes, Arcs):
+    # Tail and head node numbers of every arc, in the order of Arcs
+    index = {v: k for k, v in enumerate(Nodes)}
+    tails, heads = zip(*Arcs) if len(Arcs) else ((), ())
+    tail = np.fromiter(map(index.__getitem__, tails), dtype=np.int64, count=len(Arcs))
+    head = np.fromiter(map(index.__getitem__, heads), dtype=np.int64, count=len(Arcs))
+    return tail, head
+
+def arcValues(Arcs, values):
+    # Array of a multidict parameter in the order of Arcs
+    return np.fromiter(map(values.__getitem__, Arcs), dtype=float, count=len(Arcs))
+
+def incidenceMatrix(n, tail, head):
+    # Node-arc incidence matrix: +1 in the row of the tail, -1 in the row of the head
+    m = len(tail)
+    rows = np.concatenate([tail, head])
+    cols = np.concatenate([np.arange(m), np.arange(m)])
+    values = np.concatenate([np.ones(m), -np.ones(m)])
+    return sp.csr_matrix((values, (rows, cols)), shape=(n, m))
+
+def buildMinCostFlow(Nodes, Arcs, Supply, cost, lb, ub, env=None):
+    # Flow balance (out - in = Supply) of every node, all variables and rows added at once
+    tail, head = arcArrays(Nodes, Arcs)
+    model = Model('minCost', env=env)
+    x = model.addMVar(len(Arcs), lb=arcValues(Arcs, lb), ub=arcValues(Arcs, ub), obj=arcValues(Arcs, cost), name='x')
+    model.modelSense = GRB.MINIMIZE
+    b = np.fromiter(map(Supply.__getitem__, Nodes), dtype=float, count=len(Nodes))
+    balance = model.addMConstr(incidenceMatrix(len(Nodes), tail, head), x, '=', b, name='node')
+    model._x = x
+    model._balance = balance
+    return model, x
+
+def flowDict(Arcs, x):
+    # Flow of every arc keyed like the Arcs tuplelist
+    return dict(zip(Arcs, x.X.tolist()))
+
+def printSolution(objVal, flow):
+    if flow is not None:
+        print('\nMinimum Cost: %g' % objVal)
+        for (i, j), value in flow.items():
+            if value > 0.1:
+                print('Arc (%s,%s): %g' % (i, j, value))
+    else:
+        print('No solution')
+
+def networkSimplex(Nodes, Arcs, Supply, cost, lb, ub):
+    tail, head = arcArrays(Nodes, Arcs)
+    solver = NetworkSimplex(len(Nodes), tail, head, arcValues(Arcs, cost), arcValues(Arcs, lb), arcValues(Arcs, ub),
+                            np.fromiter(map(Supply.__getitem__, Nodes), dtype=float, count=len(Nodes)))
+    solver.solve()
+    return solver
+
+def minCostFlow(Nodes, Arcs, Supply, cost, lb, ub, method='gurobi', verbose=True):
+    # Solved by Gurobi ('gurobi') or by the network simplex ('simplex'),
+    # returns the minimum cost and the flow of every arc (None if there is no solution)
+    if method == 'gurobi':
+        model, x = buildMinCostFlow(Nodes, Arcs, Supply, cost, lb, ub)
+        model.setParam('OutputFlag', 1 if verbose else 0)
+        model.optimize()
+        objVal, flow = (model.objVal, flowDict(Arcs, x)) if model.status == GRB.status.OPTIMAL else (None, None)
+    elif method == 'simplex':
+        solver = networkSimplex(Nodes, Arcs, Supply, cost, lb, ub)
+        objVal, flow = (solver.objVal, dict(zip(Arcs, solver.flow.tolist()))) if solver.status == OPTIMAL else (None, None)
+    else:
+        raise ValueError("Unknown min cost flow method: {}".format(method))
+    if verbose:
+        printSolution(objVal, flow)
+    return objVal, flow
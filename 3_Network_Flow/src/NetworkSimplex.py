@@ -0,0 +1,195 @@
+import math
+import numpy as np
+
+# Solution status
+OPTIMAL = 'optimal'
+INFEASIBLE = 'infeasible'
+UNBOUNDED = 'unbounded'
+
+# Arc states
+TREE = 0
+LOWER = 1
+UPPER = -1
+
+# Direction of the arc from a node to its parent in the spanning tree
+UP = 1    # node -> parent
+DOWN = -1 # parent -> node
+
+
+class NetworkSimplex:
+    # Primal network simplex for min sum(c x) s.t. out(v) - in(v) = supply(v),
+    # lower <= x <= upper. Arcs are numbered 0..m-1 with source and target node numbers,
+    # lower bounds are shifted out of the problem first. The spanning tree starts with one
+    # artificial arc per node to an extra root node and is kept strongly feasible
+    # (Cunningham's rule for the leaving arc), so it does not cycle. Entering arcs are
+    # chosen by block search over NumPy arrays of reduced costs c_ij - pi_i + pi_j
+
+    def __init__(self, n, source, target, cost, lower, upper, supply):
+        self.n = n
+        self.m = len(source)
+        self.source = np.asarray(source, dtype=np.int64)
+        self.target = np.asarray(target, dtype=np.int64)
+        self.cost = np.asarray(cost, dtype=float)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.supply = np.asarray(supply, dtype=float)
+        self.pivots = 0
+
+    def solve(self):
+        n, m = self.n, self.m
+        root = n
+        if np.any(self.lower > self.upper):
+            self.status = INFEASIBLE
+            return self.status
+
+        # Shift the lower bounds: x = lower + y with 0 <= y <= upper - lower
+        b = self.supply.copy()
+        np.subtract.at(b, self.source, self.lower)
+        np.add.at(b, self.target, self.lower)
+        if abs(b.sum()) > 1e-9 * max(1.0, np.abs(b).sum()):
+            self.status = INFEASIBLE
+            return self.status
+
+        # Arcs m..m+n-1 are the artificial arcs between node i and the root
+        M = (n + 1) * max(1.0, np.abs(self.cost).max() if m else 1.0)
+        positive = b >= 0
+        source = np.concatenate([self.source, np.where(positive, np.arange(n), root)])
+        target = np.concatenate([self.target, np.where(positive, root, np.arange(n))])
+        cost = np.concatenate([self.cost, np.full(n, M)])
+        cap = np.concatenate([np.where(self.upper >= 1e30, math.inf, self.upper - self.lower), np.full(n, math.inf)])
+        flow = [0.0] * m + np.abs(b).tolist()
+        state = np.concatenate([np.full(m, LOWER, dtype=np.int64), np.full(n, TREE, dtype=np.int64)])
+
+        parent = [root] * n + [-1]
+        pred = list(range(m, m + n)) + [-1]
+        predDir = [UP if p else DOWN for p in positive.tolist()] + [0]
+        depth = [1] * n + [0]
+        children = [set() for v in range(n)] + [set(range(n))]
+        pi = np.where(positive, M, -M).tolist() + [0.0]
+        pi = np.array(pi)
+        src, tgt, capList, costList = source.tolist(), target.tolist(), cap.tolist(), cost.tolist()
+
+        block = max(10, int(math.sqrt(m + n)))
+        start = 0
+        while True:
+            # Block search: the most violating arc of the first block that has one
+            entering = -1
+            scanned = 0
+            total = m + n
+            while scanned < total:
+                end = min(start + block, total)
+                arcs = np.arange(start, end)
+                violation = state[arcs] * (cost[arcs] - pi[source[arcs]] + pi[target[arcs]])
+                k = int(np.argmin(violation))
+                scanned += end - start
+                start = end % total
+                if violation[k] < -1e-9:
+                    entering = int(arcs[k])
+                    break
+            if entering < 0:
+                break
+            self.pivots += 1
+
+            # Cycle of the entering arc: first -> second along the arc, back through the tree
+            if state[entering] == LOWER:
+                first, second = src[entering], tgt[entering]
+            else:
+                first, second = tgt[entering], src[entering]
+            u, v = first, second
+            while u != v:
+                if depth[u] > depth[v]:
+                    u = parent[u]
+                elif depth[v] > depth[u]:
+                    v = parent[v]
+                else:
+                    u, v = parent[u], parent[v]
+            join = u
+
+            delta = capList[entering]
+            leaving = entering
+            side = 0
+            u = first
+            while u != join:
+                e = pred[u]
+                d = flow[e] if predDir[u] == UP else capList[e] - flow[e]
+                if d < delta:
+                    delta, leaving, side = d, u, 1
+                u = parent[u]
+            u = second
+            while u != join:
+                e = pred[u]
+                d = capList[e] - flow[e] if predDir[u] == UP else flow[e]
+                if d <= delta:
+                    delta, leaving, side = d, u, 2
+                u = parent[u]
+            if delta == math.inf:
+                self.status = UNBOUNDED
+                return self.status
+
+            # Augment delta around the cycle
+            if delta > 0:
+                value = int(state[entering]) * delta
+                flow[entering] += value
+                u = src[entering]
+                while u != join:
+                    flow[pred[u]] -= predDir[u] * value
+                    u = parent[u]
+                u = tgt[entering]
+                while u != join:
+                    flow[pred[u]] += predDir[u] * value
+                    u = parent[u]
+
+            if side == 0:
+                # The entering arc goes from one bound to the other
+                state[entering] = -state[entering]
+                continue
+
+            # Replace the tree arc above `leaving` with the entering arc: the path from the
+            # entering end up to `leaving` is turned around and hangs below the other end
+            if side == 1:
+                uIn, vIn = first, second
+            else:
+                uIn, vIn = second, first
+            out = pred[leaving]
+            state[out] = LOWER if flow[out] <= 0 else UPPER
+            state[entering] = TREE
+            path = [uIn]
+            while path[-1] != leaving:
+                path.append(parent[path[-1]])
+            children[parent[leaving]].discard(leaving)
+            for k in range(len(path) - 1, 0, -1):
+                a, below = path[k], path[k - 1]
+                parent[a] = below
+                pred[a] = pred[below]
+                predDir[a] = -predDir[below]
+                children[a].discard(below)
+                children[below].add(a)
+            parent[uIn] = vIn
+            pred[uIn] = entering
+            predDir[uIn] = UP if src[entering] == uIn else DOWN
+            children[vIn].add(uIn)
+
+            # Potentials and depths of the moved subtree
+            if predDir[uIn] == UP:
+                sigma = costList[entering] + pi[vIn] - pi[uIn]
+            else:
+                sigma = pi[vIn] - costList[entering] - pi[uIn]
+            subtree = [uIn]
+            depth[uIn] = depth[vIn] + 1
+            k = 0
+            while k < len(subtree):
+                a = subtree[k]
+                for c in children[a]:
+                    depth[c] = depth[a] + 1
+                    subtree.append(c)
+                k += 1
+            pi[subtree] += sigma
+
+        if any(flow[e] > 1e-9 for e in range(m, m + n)):
+            self.status = INFEASIBLE
+            return self.status
+        self.flow = np.array(flow[:m]) + self.lower
+        self.potential = pi[:n] - pi[root]
+        self.objVal = float(self.cost @ self.flow) if m else 0.0
+        self.status = OPTIMAL
+        return self.status
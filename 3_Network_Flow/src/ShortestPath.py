@@ -0,0 +1,143 @@
+from gurobipy import *
+from collections import deque
+import heapq
+import math
+import numpy as np
+from NetworkFlow import *
+
+
+def dijkstra(n, first, head, weight, source):
+    # Binary heap Dijkstra for nonnegative weights, the edges of u are first[u]:first[u+1].
+    # Returns the distances and the edge into every node on its shortest path (-1 if none)
+    dist = [math.inf] * n
+    pred = [-1] * n
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue # Stale entry, u was reached by a shorter path
+        for e in range(first[u], first[u + 1]):
+            v = head[e]
+            dv = d + weight[e]
+            if dv < dist[v]:
+                dist[v] = dv
+                pred[v] = e
+                heapq.heappush(heap, (dv, v))
+    return dist, pred
+
+def spfa(n, first, head, weight, source):
+    # Bellman-Ford with a FIFO queue of the nodes whose distance changed (SPFA), any weights.
+    # A node dequeued n times lies on or behind a negative cycle
+    dist = [math.inf] * n
+    pred = [-1] * n
+    dist[source] = 0.0
+    queued = [False] * n
+    passes = [0] * n
+    queue = deque([source])
+    queued[source] = True
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        passes[u] += 1
+        if passes[u] > n:
+            raise ValueError("Negative cycle reachable from node {}".format(source))
+        d = dist[u]
+        for e in range(first[u], first[u + 1]):
+            v = head[e]
+            dv = d + weight[e]
+            if dv < dist[v]:
+                dist[v] = dv
+                pred[v] = e
+                if not queued[v]:
+                    queued[v] = True
+                    queue.append(v)
+    return dist, pred
+
+
+class ShortestPaths:
+    # Shortest paths on the graph of an Arcs tuplelist with arc lengths cost, kept as CSR
+    # arrays (arcs sorted by tail). The shortest path tree of every source is computed once
+    # by Dijkstra if all lengths are nonnegative, otherwise by SPFA, and kept for later queries
+
+    def __init__(self, Nodes, Arcs, cost, method=None):
+        tail, head = arcArrays(Nodes, Arcs)
+        weight = arcValues(Arcs, cost)
+        order = np.argsort(tail, kind='stable')
+        self.Nodes = list(Nodes)
+        self.index = {v: k for k, v in enumerate(self.Nodes)}
+        self.first = np.searchsorted(tail[order], np.arange(len(self.Nodes) + 1)).tolist()
+        self.tail = tail[order].tolist()
+        self.head = head[order].tolist()
+        self.weight = weight[order].tolist()
+        if method is None:
+            method = 'dijkstra' if len(weight) == 0 or weight.min() >= 0 else 'spfa'
+        if method not in ('dijkstra', 'spfa'):
+            raise ValueError("Unknown shortest path method: {}".format(method))
+        if method == 'dijkstra' and len(weight) and weight.min() < 0:
+            raise ValueError("Dijkstra needs nonnegative arc lengths")
+        self.method = method
+        self.trees = {}
+
+    def tree(self, source):
+        # Distances and predecessor arcs from source, by node number
+        s = self.index[source]
+        if s not in self.trees:
+            solve = dijkstra if self.method == 'dijkstra' else spfa
+            self.trees[s] = solve(len(self.Nodes), self.first, self.head, self.weight, s)
+        return self.trees[s]
+
+    def distances(self, source):
+        # One to all: length of the shortest path from source to every node (inf if unreachable)
+        dist, pred = self.tree(source)
+        return dict(zip(self.Nodes, dist))
+
+    def distance(self, source, target):
+        return self.tree(source)[0][self.index[target]]
+
+    def path(self, source, target):
+        # Nodes of a shortest path from source to target, None if there is none
+        dist, pred = self.tree(source)
+        v = self.index[target]
+        if dist[v] == math.inf:
+            return None
+        path = [v]
+        while pred[v] >= 0:
+            v = self.tail[pred[v]]
+            path.append(v)
+        return [self.Nodes[v] for v in reversed(path)]
+
+    def query(self, pairs):
+        # Many pairs at once, one tree per distinct source: {(source, target): length}
+        return {(s, t): self.distance(s, t) for s, t in pairs}
+
+
+def shortestPathLP(Nodes, Arcs, cost, source, target, env=None):
+    # The unit flow formulation: one unit of supply at source, one unit of demand at target,
+    # arc capacity one. Returns the length and the nodes of the path, None if target cannot be reached
+    Supply = dict.fromkeys(Nodes, 0)
+    Supply[source] += 1
+    Supply[target] -= 1
+    model, x = buildMinCostFlow(Nodes, Arcs, Supply, cost, dict.fromkeys(Arcs, 0), dict.fromkeys(Arcs, 1), env)
+    model.setParam('OutputFlag', 0)
+    model.optimize()
+    if model.status != GRB.OPTIMAL:
+        return None
+    out = {}
+    for (i, j), value in flowDict(Arcs, x).items():
+        if value > 0.5:
+            out.setdefault(i, []).append(j)
+    # A degenerate optimum can also send the unit around a zero cost cycle through the path: use
+    # every arc once and cut out the cycles the walk closes
+    path = [source]
+    position = {source: 0}
+    while path[-1] != target:
+        j = out[path[-1]].pop()
+        if j in position:
+            for v in path[position[j] + 1:]:
+                del position[v]
+            del path[position[j] + 1:]
+        else:
+            position[j] = len(path)
+            path.append(j)
+    return model.objVal, path
@@ -0,0 +1,94 @@
+from gurobipy import *
+import numpy as np
+import time
+
+
+def degeneracyOrder(G):
+    # Repeatedly remove a vertex of minimum remaining degree (bucket queue, O(n + m)).
+    # Returns the removal order and the degeneracy of G
+    deg = G.degree().tolist()
+    buckets = [set() for d in range(max(deg, default=0) + 1)]
+    for v in range(G.n):
+        buckets[deg[v]].add(v)
+    removed = [False] * G.n
+    order = []
+    degeneracy = 0
+    d = 0
+    for _ in range(G.n):
+        while not buckets[d]:
+            d += 1
+        v = buckets[d].pop()
+        degeneracy = max(degeneracy, d)
+        order.append(v)
+        removed[v] = True
+        for u in G.neighbors(v).tolist():
+            if not removed[u]:
+                buckets[deg[u]].remove(u)
+                deg[u] -= 1
+                buckets[deg[u]].add(u)
+        d = max(d - 1, 0)
+    return order, degeneracy
+
+def edgeCliqueCover(G):
+    # Greedy maximal cliques over the degeneracy order: every edge {v, u} with u
+    # after v is covered by a clique of v's later neighborhood (at most
+    # degeneracy vertices), grown from {v, u} preferring still uncovered edges of v
+    order, degeneracy = degeneracyOrder(G)
+    position = np.empty(G.n, dtype=np.int64)
+    position[order] = np.arange(G.n)
+    covered = set()
+    cliques = []
+    for v in order:
+        neighbors = G.neighbors(v)
+        later = set(neighbors[position[neighbors] > position[v]].tolist())
+        for u in sorted(later):
+            if v * G.n + u in covered:
+                continue
+            clique = [v, u]
+            candidates = later & set(G.neighbors(u).tolist())
+            while candidates:
+                w = max(candidates, key=lambda c: (v * G.n + c not in covered, -c))
+                clique.append(w)
+                candidates &= set(G.neighbors(w).tolist())
+            for a in clique:
+                for b in clique:
+                    if a != b:
+                        covered.add(a * G.n + b)
+            cliques.append(clique)
+    return cliques
+
+def addEdgeConstrs(model, x, I, J):
+    # x_i + x_j <= 1 for every edge {I[e], J[e]}
+    if len(I) > 0:
+        model.addConstr(x[I] + x[J] <= 1)
+
+def addCliqueConstrs(model, x, cliques):
+    # sum(x_i, i in C) <= 1 for every clique, one matrix constraint per clique size
+    sizes = {}
+    for clique in cliques:
+        sizes.setdefault(len(clique), []).append(clique)
+    for size, group in sizes.items():
+        C = np.array(group)
+        model.addConstr(sum(x[C[:, t]] for t in range(size)) <= 1)
+
+def rootBound(n, addRows):
+    # Objective of the LP relaxation of vertex packing with the rows added by addRows(model, x)
+    model = Model('VertexPackingLP')
+    model.Params.OutputFlag = 0
+    x = model.addMVar(n, ub=1, obj=1, name="x")
+    model.modelSense = GRB.MAXIMIZE
+    addRows(model, x)
+    start = time.time()
+    model.optimize()
+    return model.objval, time.time() - start
+
+def reportCliqueCover(G, cliques):
+    # Compare the edge formulation with the clique cover formulation at the root
+    I, J = G.edges()
+    edgeBound, edgeTime = rootBound(G.n, lambda model, x: addEdgeConstrs(model, x, I, J))
+    cliqueBound, cliqueTime = rootBound(G.n, lambda model, x: addCliqueConstrs(model, x, cliques))
+    print("-----------")
+    print("Edge formulation:   {} rows, LP bound {:.4f} ({:.3f}s)".format(G.m, edgeBound, edgeTime))
+    print("Clique formulation: {} rows, LP bound {:.4f} ({:.3f}s)".format(len(cliques), cliqueBound, cliqueTime))
+    print("Row reduction: {:.1f}%, bound improvement: {:.4f}".format(100.0 * (1 - len(cliques) / max(G.m, 1)), edgeBound - cliqueBound))
+    print("-----------")
@@ -0,0 +1,155 @@
+from gurobipy import *
+import numpy as np
+import time
+
+# Separation modes
+HEURISTIC = 'heuristic' # greedy + local search only
+EXACT = 'exact'         # solve the MWC binary program every time
+HYBRID = 'hybrid'       # heuristic first, MWC only if it finds nothing
+
+EPS = 1e-6 # Violation tolerance for sum(x_i, i in C) > 1
+
+
+def bits(mask):
+    # Iterate over the vertices in a bitset
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def greedyClique(clique, candidates, weight, adj):
+    # Grow clique by repeatedly adding the heaviest vertex adjacent to every member
+    clique = list(clique)
+    while candidates:
+        v = max(bits(candidates), key=lambda u: weight[u])
+        clique.append(v)
+        candidates &= adj[v]
+    return clique
+
+def localSearch(clique, support, weight, adj, maxRounds=50):
+    # (1,k)-swaps: drop one member u and greedily refill with vertices of the
+    # support adjacent to every other member, keep the move if it gains weight
+    for _ in range(maxRounds):
+        improved = False
+        members = 0
+        for v in clique:
+            members |= 1 << v
+        for u in clique:
+            common = support & ~members
+            for v in clique:
+                if v != u:
+                    common &= adj[v]
+            if not common:
+                continue
+            rest = [v for v in clique if v != u]
+            refill = greedyClique(rest, common, weight, adj)
+            if sum(weight[v] for v in refill) > sum(weight[v] for v in clique) + EPS:
+                clique = refill
+                improved = True
+                break
+        if not improved:
+            break
+    return clique
+
+def liftClique(clique, n, adj):
+    # Extend to a maximal clique of G with zero-weight vertices, the resulting cut dominates
+    common = (1 << n) - 1
+    for v in clique:
+        common &= adj[v]
+    clique = list(clique)
+    while common:
+        v = next(bits(common))
+        clique.append(v)
+        common &= adj[v]
+    return clique
+
+
+class CliqueSeparator:
+
+    # G is a Graph (see Graph.py), adjacency is read through its bitsets.
+    # MWC and y are the exact max weight clique model and its MVar of vertices
+
+    def __init__(self, G, mode=HYBRID, MWC=None, y=None, starts=10):
+        if mode not in (HEURISTIC, EXACT, HYBRID):
+            raise ValueError("Unknown separation mode: {}".format(mode))
+        if mode != HEURISTIC and MWC is None:
+            raise ValueError("Mode '{}' requires the MWC model".format(mode))
+        self.n = G.n
+        self.adj = G.bitsets
+        self.mode = mode
+        self.MWC = MWC
+        self.y = y
+        self.starts = starts # Number of greedy starting vertices
+        # Statistics
+        self.heuristicCalls = 0
+        self.heuristicCuts = 0
+        self.heuristicTime = 0.0
+        self.exactCalls = 0
+        self.exactCuts = 0
+        self.exactTime = 0.0
+
+    def heuristic(self, weight, k=1):
+        # One greedy + local search run per starting vertex, returns up to k
+        # distinct violated cliques, most violated first
+        start = time.time()
+        self.heuristicCalls += 1
+        support = 0
+        for i in np.flatnonzero(weight > EPS):
+            support |= 1 << int(i)
+        # Start where a violated clique can be: rank the vertices by their weight plus the weight
+        # of their support neighbours, a vertex with none only makes a singleton (x_v = 1 and
+        # all neighbours 0 is the usual case)
+        score = {}
+        for i in bits(support):
+            around = sum(weight[u] for u in bits(support & self.adj[i]))
+            if around > EPS:
+                score[i] = weight[i] + around
+        order = sorted(score, key=lambda i: -score[i])
+        found = {}
+        for v in order[:max(self.starts, k)]:
+            clique = greedyClique([v], support & self.adj[v], weight, self.adj)
+            clique = localSearch(clique, support, weight, self.adj)
+            cliqueWeight = sum(weight[i] for i in clique)
+            if cliqueWeight > 1 + EPS:
+                found[tuple(sorted(clique))] = cliqueWeight
+        cliques = sorted(found, key=lambda c: -found[c])[:k]
+        cliques = [liftClique(c, self.n, self.adj) for c in cliques]
+        self.heuristicCuts += len(cliques)
+        self.heuristicTime += time.time() - start
+        return cliques
+
+    def exact(self, weight, k=1):
+        # Solve MWC, every solution in its pool with weight > 1 is a violated clique. PoolSearchMode 2
+        # makes the pool the k heaviest cliques, not whatever solutions the search came across
+        start = time.time()
+        self.exactCalls += 1
+        self.y.Obj = weight
+        self.MWC.Params.PoolSolutions = k
+        self.MWC.Params.PoolSearchMode = 2
+        self.MWC.optimize()
+        cliques = []
+        if self.MWC.status == GRB.OPTIMAL:
+            for s in range(self.MWC.SolCount):
+                self.MWC.Params.SolutionNumber = s
+                if self.MWC.PoolObjVal > 1 + EPS:
+                    cliques.append(np.flatnonzero(self.y.Xn > 0.5).tolist())
+        self.exactCuts += len(cliques)
+        self.exactTime += time.time() - start
+        return cliques
+
+    def separate(self, weight, k=1):
+        # Returns up to k cliques C with sum(weight[i], i in C) > 1, most violated first
+        weight = np.asarray(weight, dtype=float)
+        cliques = []
+        if self.mode in (HEURISTIC, HYBRID):
+            cliques = self.heuristic(weight, k)
+        if not cliques and self.mode in (EXACT, HYBRID):
+            cliques = self.exact(weight, k)
+        return cliques
+
+    def printStatistics(self):
+        print("-----------")
+        print("Separation mode: {}".format(self.mode))
+        print("Heuristic: {} calls, {} cuts, {:.3f}s".format(self.heuristicCalls, self.heuristicCuts, self.heuristicTime))
+        print("Exact MWC: {} calls, {} cuts, {:.3f}s".format(self.exactCalls, self.exactCuts, self.exactTime))
+        print("-----------")
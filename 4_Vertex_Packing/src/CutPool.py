@@ -0,0 +1,70 @@
+import numpy as np
+import os
+
+EPS = 1e-6 # Violation tolerance for sum(x_i, i in C) > 1
+
+
+class CutPool:
+    # Clique inequalities sum(x_i, i in C) <= 1 found so far for the graph G,
+    # each clique is stored once under its sorted vertex tuple
+
+    def __init__(self, G):
+        self.G = G
+        self.cliques = {} # canonical clique -> number of times it was added as a cut
+        self._keys = None # flattened cliques for vectorized evaluation
+        self._members = None
+        self._starts = None
+
+    def __len__(self):
+        return len(self.cliques)
+
+    def add(self, clique):
+        # Returns True if the clique was not in the pool yet
+        key = tuple(sorted(int(i) for i in clique))
+        if key in self.cliques:
+            return False
+        self.cliques[key] = 0
+        self._members = None
+        return True
+
+    def used(self, clique):
+        self.cliques[tuple(sorted(int(i) for i in clique))] += 1
+
+    def violated(self, weight, k=1):
+        # Up to k pool cliques with sum(weight[i], i in C) > 1, most violated first
+        if not self.cliques:
+            return []
+        if self._members is None:
+            keys = list(self.cliques)
+            self._keys = keys
+            self._members = np.fromiter((i for c in keys for i in c), dtype=np.int64)
+            self._starts = np.cumsum([0] + [len(c) for c in keys[:-1]])
+        lhs = np.add.reduceat(np.asarray(weight, dtype=float)[self._members], self._starts)
+        found = np.flatnonzero(lhs > 1 + EPS)
+        found = found[np.argsort(-lhs[found])][:k]
+        return [list(self._keys[c]) for c in found]
+
+    def save(self, outputfile):
+        # One clique per line after a header with the size of the graph
+        f = open(outputfile, 'w')
+        f.write("{} {}\n".format(self.G.n, self.G.m))
+        for clique in self.cliques:
+            f.write(" ".join(str(i) for i in clique) + "\n")
+        f.close()
+
+    def load(self, inputfile):
+        # Read the pool saved for the same graph, cliques that are not cliques of G are skipped
+        if not os.path.exists(inputfile):
+            return 0
+        f = open(inputfile, 'r')
+        fields = str.split(f.readline())
+        if int(fields[0]) != self.G.n or int(fields[1]) != self.G.m:
+            f.close()
+            return 0
+        added = 0
+        for line in f:
+            clique = [int(i) for i in line.split()]
+            if all(self.G.isAdjacent(clique[a], clique[b]) for a in range(len(clique)) for b in range(a+1, len(clique))):
+                added += self.add(clique)
+        f.close()
+        return added
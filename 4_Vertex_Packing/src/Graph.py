@@ -0,0 +1,123 @@
+import numpy as np
+import os
+from collections import OrderedDict
+
+BLOCK_BYTES = 1 << 24 # Memory budget for one block of the complement enumeration
+BITSET_BYTES = 1 << 26 # Memory budget for the cached vertex bitsets, least recently used go first
+
+
+class BitsetView:
+    # Indexable view G.bitsets[i], builds each vertex bitset on first access
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __getitem__(self, i):
+        return self.graph.bitset(i)
+
+    def __len__(self):
+        return self.graph.n
+
+
+class Graph:
+    # Undirected graph stored in CSR form: the neighbors of i are
+    # indices[indptr[i]:indptr[i+1]], sorted and without duplicates
+
+    def __init__(self, n, indptr, indices):
+        self.n = n
+        self.m = len(indices) // 2
+        self.indptr = indptr
+        self.indices = indices
+        self.bitsets = BitsetView(self)
+        self._bitsets = OrderedDict()
+        self._cached = max(1, BITSET_BYTES // max(self.n // 8, 1)) # Bitsets of n bits that fit the budget
+
+    def neighbors(self, i):
+        return self.indices[self.indptr[i]:self.indptr[i+1]]
+
+    def degree(self):
+        return np.diff(self.indptr)
+
+    def bitset(self, i):
+        # Adjacency of i as an int whose j-th bit is set iff {i, j} is an edge. Each takes n/8 bytes,
+        # so only the most recently used ones are kept
+        if i in self._bitsets:
+            self._bitsets.move_to_end(i)
+            return self._bitsets[i]
+        mask = np.zeros(self.n, dtype=bool)
+        mask[self.neighbors(i)] = True
+        bitset = int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+        self._bitsets[i] = bitset
+        if len(self._bitsets) > self._cached:
+            self._bitsets.popitem(last=False)
+        return bitset
+
+    def isAdjacent(self, i, j):
+        neighbors = self.neighbors(i)
+        k = np.searchsorted(neighbors, j)
+        return k < len(neighbors) and neighbors[k] == j
+
+    def adjLists(self):
+        return [self.neighbors(i).tolist() for i in range(self.n)]
+
+    def edges(self):
+        # Arrays I, J with I < J, one entry per edge
+        rows = np.repeat(np.arange(self.n), self.degree())
+        keep = rows < self.indices
+        return rows[keep], np.asarray(self.indices[keep])
+
+    def complementEdges(self, block=None):
+        # Yields arrays I, J with I < J for the non-edges of G, one block of rows at a time
+        if block is None:
+            block = max(1, BLOCK_BYTES // max(self.n, 1))
+        cols = np.arange(self.n)
+        for a in range(0, self.n, block):
+            b = min(a + block, self.n)
+            start, end = self.indptr[a], self.indptr[b]
+            rows = np.repeat(np.arange(b - a), np.diff(self.indptr[a:b+1]))
+            mask = cols[None, :] > np.arange(a, b)[:, None]
+            mask[rows, self.indices[start:end]] = False
+            I, J = np.nonzero(mask)
+            yield I + a, J
+
+
+def buildCSR(n, I, J):
+    # Symmetrize, drop self loops and duplicate edges
+    keep = I != J
+    I, J = I[keep], J[keep]
+    keys = np.unique(np.concatenate((I * n + J, J * n + I)))
+    rows, indices = np.divmod(keys, n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, indices.astype(np.int32 if n < 2**31 else np.int64)
+
+def fresh(cachefile, inputfile):
+    return os.path.exists(cachefile) and os.path.getmtime(cachefile) >= os.path.getmtime(inputfile)
+
+def saveArray(cachefile, array):
+    # Written to a temporary file first, a crash never leaves a half written cache
+    f = open(cachefile + '.tmp', 'wb')
+    np.save(f, array)
+    f.close()
+    os.replace(cachefile + '.tmp', cachefile)
+
+def readGraph(inputfile, cache=True):
+    # Read a .graph.txt edge list (first line: n m, then one "i j" per line).
+    # The CSR arrays are cached next to the input as .npy files and memory-mapped on later runs
+    indptrFile = inputfile + '.indptr.npy'
+    indicesFile = inputfile + '.indices.npy'
+    if cache and fresh(indptrFile, inputfile) and fresh(indicesFile, inputfile):
+        indptr = np.load(indptrFile, mmap_mode='r')
+        indices = np.load(indicesFile, mmap_mode='r')
+        if len(indptr) > 0 and indptr[-1] == len(indices): # Otherwise the two files do not belong together
+            return Graph(len(indptr) - 1, indptr, indices)
+
+    f = open(inputfile, 'r')
+    fields = str.split(f.readline())
+    n = int(fields[0])
+    data = np.fromstring(f.read(), dtype=np.int64, sep=' ')
+    f.close()
+    indptr, indices = buildCSR(n, data[0::2], data[1::2])
+    if cache:
+        saveArray(indptrFile, indptr)
+        saveArray(indicesFile, indices)
+    return Graph(n, indptr, indices)
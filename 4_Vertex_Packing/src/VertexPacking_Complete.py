@@ -1,81 +1,87 @@
 from gurobipy import *
-
-def read(inputfile):
-    f = open(inputfile, 'r') # Open .txt file
-    line = f.readline() # Read the first line, returns string
-    fields = str.split(line) # Split the line, returns list
-    n = int(fields[0]) # Number of vertices in G
-    m = int(fields[1]) # Number of edges in G
-    adjLists = [] # Initialize adjacency list
-
-    for i in range(0, n):
-        adjLists.append([])
-
-    # Fill adjacency list
-    for line in f:
-        fields = line.split(' ')
-        i = int(fields[0])
-        j = int(fields[1])
-        adjLists[i].append(j)
-        adjLists[j].append(i)
-    f.close # Close .txt file once finished reading
-    return n, m, adjLists
-
-
-n, m, adjLists = read("../dat/jazz.graph.txt")
-
-
-MWC_model = Model('MaxWeightClique')
-MWC_model.Params.OutputFlag = 0
-y = {}
-for i in range(n):
-    y[i] = MWC_model.addVar(vtype=GRB.BINARY, name="y_{}".format(i))
-
-MWC_model.update()
-MWC_model.modelSense = GRB.MAXIMIZE
-
-for i in range(n):
-    for j in range(i+1, n):
-        if (j not in adjLists[i]):
-            MWC_model.addConstr(y[i] + y[j] <= 1)
+from CliqueCover import *
+from CliqueSeparator import *
+from CutPool import *
+from Graph import *
+
+# Separation mode: HEURISTIC, EXACT or HYBRID. EXACT and HYBRID build the max weight clique
+# model with one row per non-edge, O(n^2) rows, so above EXACT_LIMIT vertices HEURISTIC is used
+SEPARATION = HYBRID
+EXACT_LIMIT = 2000
+TOP_K = 5 # Maximum number of clique cuts added per node relaxation
+CLIQUE_COVER = True # Start VP_model from an edge clique cover instead of one row per edge
+REPORT_COVER = False # Print the row reduction and root bound of the clique cover
+
+inputfile = "../dat/jazz.graph.txt"
+G = readGraph(inputfile) # CSR adjacency, cached as .npy next to the data
+n, m = G.n, G.m
+I, J = G.edges()
+if SEPARATION != HEURISTIC and n > EXACT_LIMIT:
+    print('{} vertices: {} separation needs O(n^2) rows, using {}'.format(n, SEPARATION, HEURISTIC))
+    SEPARATION = HEURISTIC
+
+
+MWC_model = None
+y = None
+if SEPARATION in (EXACT, HYBRID):
+    MWC_model = Model('MaxWeightClique')
+    MWC_model.Params.OutputFlag = 0
+    y = MWC_model.addMVar(n, vtype=GRB.BINARY, name="y")
+
+    MWC_model.update()
+    MWC_model.modelSense = GRB.MAXIMIZE
+
+    # y_i + y_j <= 1 for every non-edge, added one block of rows at a time
+    for cI, cJ in G.complementEdges():
+        if len(cI) > 0:
+            MWC_model.addConstr(y[cI] + y[cJ] <= 1)
 
 
 VP_model = Model('VertexPacking')
 VP_model.Params.PreCrush = 1 # Allow user cuts
 VP_model.Params.CliqueCuts = 0 # Prevent Gurobi from adding their clique cuts
 VP_model.Params.Presolve = 0 #
-x = {}
-for i in range(n):
-    x[i] = VP_model.addVar(vtype=GRB.BINARY, obj = 1, name="x_{}".format(i))
+xv = VP_model.addMVar(n, vtype=GRB.BINARY, obj = 1, name="x")
+x = xv.tolist()
 
 VP_model.update()
 VP_model.modelSense = GRB.MAXIMIZE
 
-for i in range(n):
-    for j in adjLists[i]:
-        if (i < j):
-            VP_model.addConstr(x[i] + x[j] <= 1)
+if CLIQUE_COVER:
+    cliques = edgeCliqueCover(G)
+    addCliqueConstrs(VP_model, xv, cliques)
+    if REPORT_COVER:
+        reportCliqueCover(G, cliques)
+else:
+    addEdgeConstrs(VP_model, xv, I, J)
 
 
 VP_model._x = x
 VP_model._n = n
-VP_model._MWC = MWC_model
-VP_model._y = y
+VP_model._separator = CliqueSeparator(G, mode=SEPARATION, MWC=MWC_model, y=y)
+VP_model._pool = CutPool(G)
+print('Loaded {} cliques from the cut pool'.format(VP_model._pool.load(inputfile + '.cuts')))
 
 def CliqueCuts(VP_model, where):
     if (where == GRB.Callback.MIPNODE):
         status = VP_model.cbGet(GRB.Callback.MIPNODE_STATUS)
         if status == GRB.OPTIMAL:
             x_sol = VP_model.cbGetNodeRel(VP_model._x)
-            for i in range(n):
-                VP_model._y[i].Obj = x_sol[i]
-            VP_model._MWC.optimize()
-            print('Max weighted clique: {}'.format(MWC_model.objval))
-            for i in range(n):
-                if (y[i].x > 0.5):
+            # Violated cliques of the pool first, separation only for the remaining slots
+            cliques = VP_model._pool.violated(x_sol, TOP_K)
+            if len(cliques) < TOP_K:
+                for clique in VP_model._separator.separate(x_sol, TOP_K - len(cliques)):
+                    if VP_model._pool.add(clique):
+                        cliques.append(clique)
+            for clique in cliques:
+                print('Max weighted clique: {}'.format(sum(x_sol[i] for i in clique)))
+                for i in clique:
                     print("{} ".format(i), end='')
-            print("\n")
-            if VP_model._MWC.objval > 1:
-                VP_model.cbCut(quicksum(VP_model._x[i]*y[i].x for i in range(VP_model._n)) <= 1)
+                print("\n")
+                VP_model._pool.used(clique)
+                VP_model.cbCut(quicksum(VP_model._x[i] for i in clique) <= 1)
 
 VP_model.optimize(CliqueCuts)
+VP_model._separator.printStatistics()
+VP_model._pool.save(inputfile + '.cuts')
+print('Saved {} cliques to the cut pool'.format(len(VP_model._pool)))
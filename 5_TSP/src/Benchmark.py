@@ -0,0 +1,76 @@
+from gurobipy import *
+import numpy as np
+import time
+import tracemalloc
+from Distance import *
+from TSPModel import *
+
+# Compare the asymmetric and symmetric formulations, then the solve with and
+# without the heuristic warm start and repair, on the bundled instance and on
+# random instances of increasing size
+
+SIZES = [50, 100, 200]
+SEED = 0
+GOOD = 0.01 # An incumbent is good once it is within 1% of the final objective
+
+def randomInstance(n, seed=0):
+    # Cities uniform in the same 20 x 20 square as TSP_instance_n_50_s_0.dat
+    return np.random.default_rng(seed).uniform(0, 20, size=(n, 2))
+
+def benchmark(location, formulation):
+    distance = calcDistance(location)
+    tracemalloc.start()
+    start = time.time()
+    TSP = buildTSP(distance, formulation)
+    TSP.update()
+    buildTime = time.time() - start
+    pythonMemory = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    TSP.Params.OutputFlag = 0
+    start = time.time()
+    TSP._heuristic = False
+    solveTSP(TSP, distance)
+    solveTime = time.time() - start
+    row = [TSP.NumVars, TSP.NumConstrs, TSP.NumNZs, buildTime, pythonMemory, solveTime, TSP.objVal]
+    TSP.dispose()
+    return row
+
+def benchmarkHeuristic(location, formulation, heuristic):
+    # Times are measured from the start of the model build
+    distance = calcDistance(location)
+    start = time.time()
+    TSP = buildTSP(distance, formulation)
+    TSP.Params.OutputFlag = 0
+    TSP._heuristic = heuristic
+    incumbents = []
+    if heuristic:
+        tour = initialTour(distance)
+        setStart(TSP, tour)
+        incumbents.append((time.time() - start, tourLength(tour, distance)))
+    solveStart = time.time() - start
+    solveTSP(TSP, distance)
+    solveTime = time.time() - start
+    incumbents += [(solveStart + t, obj) for t, obj in TSP._incumbents]
+    firstGood = min(t for t, obj in incumbents if obj <= TSP.objVal * (1 + GOOD))
+    row = ['on' if heuristic else 'off', firstGood, solveTime, TSP.objVal]
+    TSP.dispose()
+    return row
+
+instances = [('TSP_instance_n_50_s_0', np.loadtxt('../dat/TSP_instance_n_50_s_0.dat', skiprows=1))]
+instances += [('random_n_{}_s_{}'.format(n, SEED), randomInstance(n, SEED)) for n in SIZES]
+
+# PyMem is the peak memory allocated by Python while building, Nonzeros the size of the model
+print('{:<24}{:<12}{:>8}{:>8}{:>10}{:>10}{:>12}{:>10}{:>12}'.format(
+    'Instance', 'Model', 'Vars', 'Constrs', 'Nonzeros', 'Build(s)', 'PyMem(MB)', 'Solve(s)', 'Objective'))
+for name, location in instances:
+    for formulation in [ASYMMETRIC, SYMMETRIC]:
+        row = benchmark(location, formulation)
+        print('{:<24}{:<12}{:>8}{:>8}{:>10}{:>10.3f}{:>12.2f}{:>10.2f}{:>12.4f}'.format(name, formulation, *row))
+
+print()
+print('{:<24}{:<12}{:>10}{:>14}{:>10}{:>12}'.format('Instance', 'Model', 'Heuristic', 'FirstGood(s)', 'Total(s)', 'Objective'))
+for name, location in instances:
+    for formulation in [ASYMMETRIC, SYMMETRIC]:
+        for heuristic in [False, True]:
+            row = benchmarkHeuristic(location, formulation, heuristic)
+            print('{:<24}{:<12}{:>10}{:>14.3f}{:>10.3f}{:>12.4f}'.format(name, formulation, *row))
@@ -0,0 +1,39 @@
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+
+def calcDistance(location):
+    # Euclidean distance matrix of an n x 2 array of coordinates
+    location = np.asarray(location, dtype=float)
+    return np.hypot(location[:, None, 0] - location[None, :, 0], location[:, None, 1] - location[None, :, 1])
+
+def nearestNeighbors(location, k, distance=None):
+    # n x k array with the k nearest other cities of every city, closest first
+    location = np.asarray(location, dtype=float)
+    n = len(location)
+    k = min(k, n - 1)
+    if cKDTree is not None:
+        neighbors = cKDTree(location).query(location, k=k+1)[1]
+    else:
+        if distance is None:
+            distance = calcDistance(location)
+        neighbors = np.argpartition(distance, k, axis=1)[:, :k+1]
+        order = np.argsort(np.take_along_axis(distance, neighbors, axis=1), axis=1)
+        neighbors = np.take_along_axis(neighbors, order, axis=1)
+    # Drop each city from its own list (ties at distance 0 may put it anywhere)
+    keep = neighbors != np.arange(n)[:, None]
+    keep[keep.sum(axis=1) > k, -1] = False
+    return neighbors[keep].reshape(n, k)
+
+def knnArcs(location, k, distance=None):
+    # Arcs (i, j) and (j, i) for every j among the k nearest neighbors of i, O(nk) arcs
+    neighbors = nearestNeighbors(location, k, distance)
+    n = len(neighbors)
+    I = np.repeat(np.arange(n), neighbors.shape[1])
+    J = neighbors.ravel()
+    keys = np.unique(np.concatenate((I * n + J, J * n + I)))
+    return [(int(i), int(j)) for i, j in zip(*np.divmod(keys, n))]
@@ -0,0 +1,142 @@
+import numpy as np
+
+EPS = 1e-9
+
+
+def tourLength(tour, distance):
+    tour = np.asarray(tour)
+    return distance[tour, np.roll(tour, -1)].sum()
+
+def tourArcs(tour):
+    # Arcs (tour[k], tour[k+1]) including the one closing the tour
+    return list(zip(tour, tour[1:] + tour[:1]))
+
+def nearestNeighborTour(distance, start=0):
+    # Always travel to the closest unvisited city
+    n = len(distance)
+    visited = np.zeros(n, dtype=bool)
+    tour = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, distance[tour[-1]])
+        tour.append(int(np.argmin(row)))
+        visited[tour[-1]] = True
+    return tour
+
+def greedyTour(distance):
+    # Greedy edge matching: add the shortest edges that keep every degree <= 2
+    # and close no cycle, then join the two endpoints of the resulting path
+    n = len(distance)
+    if n < 3:
+        return list(range(n))
+    I, J = np.triu_indices(n, 1)
+    order = np.argsort(distance[I, J], kind='stable')
+    degree = [0] * n
+    parent = list(range(n))
+    adjList = [[] for i in range(n)]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    added = 0
+    for e in order:
+        i, j = int(I[e]), int(J[e])
+        if degree[i] < 2 and degree[j] < 2 and find(i) != find(j):
+            parent[find(i)] = find(j)
+            degree[i] += 1
+            degree[j] += 1
+            adjList[i].append(j)
+            adjList[j].append(i)
+            added += 1
+            if added == n - 1:
+                break
+    # Walk the Hamiltonian path from one of its endpoints
+    prev, v = None, degree.index(1)
+    tour = [v]
+    while len(tour) < n:
+        nxt = adjList[v][0] if adjList[v][0] != prev else adjList[v][1]
+        prev, v = v, nxt
+        tour.append(v)
+    return tour
+
+def twoOpt(tour, distance):
+    # Best improving 2-opt move for each position, repeated until no move improves.
+    # Assumes a symmetric distance matrix (reversing a segment keeps its length)
+    tour = np.array(tour)
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(n - 2):
+            a, b = tour[i], tour[i+1]
+            c = tour[i+2:]
+            d = np.roll(tour, -1)[i+2:]
+            delta = distance[a, c] + distance[b, d] - distance[a, b] - distance[c, d]
+            if i == 0:
+                delta[-1] = 0 # (tour[n-1], tour[0]) shares city a
+            k = int(np.argmin(delta))
+            if delta[k] < -EPS:
+                j = i + 2 + k
+                tour[i+1:j+1] = tour[i+1:j+1][::-1]
+                improved = True
+    return tour.tolist()
+
+def orOpt(tour, distance, maxSegment=3):
+    # Move a segment of 1 to maxSegment cities (possibly reversed) to the best
+    # other position of the tour, repeated until no move improves
+    tour = list(tour)
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for L in range(1, min(maxSegment, n - 3) + 1):
+            for i in range(n):
+                rotated = tour[i:] + tour[:i] # segment first
+                segment = rotated[:L]
+                rest = np.array(rotated[L:])
+                p, q = rest[-1], rest[0]
+                first, last = segment[0], segment[-1]
+                gain = distance[p, first] + distance[last, q] - distance[p, q]
+                c, d = rest[:-1], rest[1:] # every edge of the remaining path
+                forward = distance[c, first] + distance[last, d] - distance[c, d]
+                backward = distance[c, last] + distance[first, d] - distance[c, d]
+                k, kb = int(np.argmin(forward)), int(np.argmin(backward))
+                best = min(forward[k], backward[kb])
+                if best < gain - EPS:
+                    if backward[kb] < forward[k]:
+                        k, segment = kb, segment[::-1]
+                    rest = rest.tolist()
+                    tour = rest[:k+1] + segment + rest[k+1:]
+                    improved = True
+                    break
+            if improved:
+                break
+    return tour
+
+def improveTour(tour, distance):
+    # Alternate 2-opt and Or-opt until neither improves the tour
+    length = tourLength(tour, distance)
+    while True:
+        tour = orOpt(twoOpt(tour, distance), distance)
+        newLength = tourLength(tour, distance)
+        if newLength > length - EPS:
+            return tour
+        length = newLength
+
+def initialTour(distance):
+    # Best of nearest neighbor and greedy construction after local search
+    tours = [improveTour(nearestNeighborTour(distance), distance), improveTour(greedyTour(distance), distance)]
+    return min(tours, key=lambda t: tourLength(t, distance))
+
+def repairTour(x_rel, distance):
+    # Nearest neighbor tour on costs d_ij (1 - x_ij), which follows the arcs of a
+    # fractional solution where it is close to integral, then local search
+    n = len(distance)
+    cost = distance.copy()
+    for (i, j), value in x_rel.items():
+        cost[i, j] *= max(1 - value, 0)
+        cost[j, i] = min(cost[j, i], cost[i, j])
+    return improveTour(nearestNeighborTour(cost), distance)
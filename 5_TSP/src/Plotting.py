@@ -0,0 +1,44 @@
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from multiprocessing import Pool
+import numpy as np
+import os
+
+LABELS = 100 # Annotate city numbers only for tours with at most this many cities
+
+
+def selectedArcs(model, x):
+    # k x 2 array of the arcs with x > 0.5, one getAttr call for all variables
+    keys = np.array(list(x.keys()), dtype=np.int64).reshape(-1, 2)
+    values = np.array(model.getAttr('X', list(x.values())))
+    return keys[values > 0.5]
+
+def drawTour(ax, location, arcs, labels=None):
+    location = np.asarray(location, dtype=float)
+    if labels is None:
+        labels = len(location) <= LABELS
+    ax.add_collection(LineCollection(location[np.asarray(arcs, dtype=np.int64).reshape(-1, 2)], colors='b', alpha=0.4, zorder=0))
+    ax.scatter(location[:, 0], location[:, 1], color='r', s=20 if labels else 4, zorder=1)
+    if labels:
+        for i in range(len(location)):
+            ax.annotate(i, (location[i, 0] + 0.25, location[i, 1] + 0.25))
+    ax.autoscale()
+    ax.margins(0.05)
+
+def renderTour(location, arcs, outputfile, labels=None, dpi=100):
+    # Draw straight to a file on an Agg canvas, no pyplot state and no display needed
+    fig = Figure(figsize=(6.4, 4.8), dpi=dpi)
+    FigureCanvasAgg(fig)
+    drawTour(fig.add_subplot(), location, arcs, labels)
+    fig.savefig(outputfile)
+
+def renderJob(job):
+    renderTour(*job)
+    return job[2]
+
+def renderTours(jobs, processes=None):
+    # jobs is a list of (location, arcs, outputfile), rendered in a process pool
+    workers = processes or os.cpu_count() or 1
+    with Pool(workers) as pool:
+        return pool.map(renderJob, jobs, chunksize=max(1, len(jobs) // (4 * workers)))
@@ -0,0 +1,62 @@
+from gurobipy import *
+import numpy as np
+
+EPS = 1e-6
+
+
+def reducedCosts(distance, u, v, subtours, w, symmetric=False):
+    # c_ij - u_i - v_j - sum(w_S, S containing i and j) for every pair, inf on the
+    # diagonal (and below it for the symmetric formulation, whose edges are i < j)
+    rc = distance - u[:, None] - v[None, :]
+    for S, w_S in zip(subtours, w):
+        rc[np.ix_(S, S)] -= w_S
+    if symmetric:
+        rc[np.tril_indices(len(rc))] = np.inf
+    np.fill_diagonal(rc, np.inf)
+    return rc
+
+def priceArcs(distance, arcs, subtours, UB, symmetric=False):
+    # LP relaxation of the TSP (degree rows plus the given subtour rows) solved
+    # by column generation over all arcs (edges i < j if symmetric). Every tour
+    # that uses arc (i,j) costs at least LB + rc_ij, so only missing arcs with
+    # rc_ij < UB - LB can improve the incumbent of value UB: these are returned
+    n = len(distance)
+    LP = Model('TSP_LP')
+    LP.Params.OutputFlag = 0
+    if symmetric:
+        leave = [LP.addConstr(LinExpr() == 2, name='degree_{}'.format(i)) for i in range(n)]
+        enter = leave
+    else:
+        leave = [LP.addConstr(LinExpr() == 1, name='leave_{}'.format(i)) for i in range(n)]
+        enter = [LP.addConstr(LinExpr() == 1, name='enter_{}'.format(i)) for i in range(n)]
+    subtour = [LP.addConstr(LinExpr() <= len(S) - 1) for S in subtours]
+    member = [set(S) for S in subtours]
+    inLP = np.zeros((n, n), dtype=bool)
+
+    def addColumns(newArcs):
+        for i, j in newArcs:
+            rows = [leave[i], enter[j]] + [subtour[s] for s in range(len(subtours)) if i in member[s] and j in member[s]]
+            LP.addVar(ub=1, obj=distance[i][j], column=Column([1.0] * len(rows), rows))
+            inLP[i, j] = True
+
+    addColumns(arcs)
+    while True:
+        LP.optimize()
+        u = np.array(LP.getAttr('Pi', leave))
+        v = np.array(LP.getAttr('Pi', enter))
+        w = np.array(LP.getAttr('Pi', subtour)) if subtours else []
+        rc = reducedCosts(distance, u, v, subtours, w, symmetric)
+        rc[inLP] = np.inf
+        newArcs = np.argwhere(rc < -EPS)
+        if len(newArcs) == 0:
+            break
+        addColumns(newArcs.tolist())
+
+    # Reduced costs with respect to the rows: any tour using (i,j) still costs at
+    # least LB + max(rc_ij, 0) once the duals of x <= 1 are accounted for
+    LB = LP.objVal
+    rc = reducedCosts(distance, u, v, subtours, w, symmetric)
+    rc = np.maximum(rc, 0)
+    for i, j in arcs:
+        rc[i, j] = np.inf
+    return [tuple(a) for a in np.argwhere(rc < UB - LB - EPS).tolist()], LB
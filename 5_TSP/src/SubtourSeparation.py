@@ -0,0 +1,84 @@
+import numpy as np
+
+EPS = 1e-6
+
+
+def find(parent, i):
+    # Root of i with path halving
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def components(nodes, edges):
+    # Connected components of the graph on nodes with the given edges (union-find). The same
+    # helper is in 6_Cutting_Stock/src/CapacitySeparation.py, keep the two alike
+    parent = {i: i for i in nodes}
+    for i, j in edges:
+        ri, rj = find(parent, i), find(parent, j)
+        if ri != rj:
+            parent[ri] = rj
+    groups = {}
+    for i in nodes:
+        groups.setdefault(find(parent, i), []).append(i)
+    return list(groups.values())
+
+def supportWeights(n, x_sol):
+    # Symmetric n x n matrix with w_ij = x_ij + x_ji (x_ij for edge variables)
+    W = np.zeros((n, n))
+    for (i, j), value in x_sol.items():
+        if value > EPS:
+            W[i, j] += value
+            W[j, i] += value
+    return W
+
+def stoerWagner(W):
+    # Every cut of the phase of the Stoer-Wagner algorithm as (value, S),
+    # the smallest of them is a global minimum cut of W
+    W = np.array(W, dtype=float)
+    n = len(W)
+    groups = [[i] for i in range(n)]
+    alive = np.ones(n, dtype=bool)
+    cuts = []
+    for phase in range(n - 1):
+        # Maximum adjacency order, the last two vertices are merged afterwards
+        first = np.flatnonzero(alive)[0]
+        connection = W[first].copy()
+        connection[~alive] = -np.inf
+        connection[first] = -np.inf
+        prev, last = first, first
+        for k in range(n - phase - 1):
+            prev, last = last, int(np.argmax(connection))
+            value = connection[last]
+            connection[last] = -np.inf
+            connection += W[last]
+        cuts.append((value, list(groups[last])))
+        W[prev] += W[last]
+        W[:, prev] += W[:, last]
+        W[prev, prev] = 0
+        W[last] = 0
+        W[:, last] = 0
+        alive[last] = False
+        groups[prev] += groups[last]
+    return cuts
+
+def fractionalSubtours(n, x_sol):
+    # Vertex sets S with x(delta(S)) < 2 in the support graph of a fractional
+    # solution. A disconnected support graph gives its components, otherwise the
+    # phase cuts of Stoer-Wagner below 2 are returned (smaller side of each cut)
+    W = supportWeights(n, x_sol)
+    I, J = np.nonzero(np.triu(W) > EPS)
+    support = components(range(n), zip(I.tolist(), J.tolist()))
+    if len(support) > 1:
+        return support
+    subtours = []
+    found = set()
+    for value, S in stoerWagner(W):
+        if value < 2 - EPS:
+            if 2 * len(S) > n:
+                S = sorted(set(range(n)) - set(S))
+            key = tuple(sorted(S))
+            if key not in found:
+                found.add(key)
+                subtours.append(list(key))
+    return subtours
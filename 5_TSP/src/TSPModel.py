@@ -0,0 +1,142 @@
+from gurobipy import *
+import numpy as np
+from Distance import *
+from Heuristics import *
+from Pricing import *
+from SubtourSeparation import *
+
+# Formulations
+ASYMMETRIC = 'asymmetric' # x[i,j] and x[j,i], leave/enter constraints
+SYMMETRIC = 'symmetric'   # x[i,j] for i < j only, degree 2 constraints
+
+
+def buildAsymmetric(distance, arcs):
+    n = len(distance)
+    TSP = Model('TSP')
+    x = TSP.addVars(arcs, vtype=GRB.BINARY, obj = [distance[i][j] for i, j in arcs], name = 'x')
+    TSP.update()
+
+    leave = {}
+    enter = {}
+    for i in range(n):
+        leave[i] = TSP.addConstr(x.sum(i, '*') == 1, name='leave_{}'.format(i))
+        enter[i] = TSP.addConstr(x.sum('*', i) == 1, name='enter_{}'.format(i))
+    return TSP, x, (leave, enter) # rows of arc (i,j) are leave[i] and enter[j]
+
+def buildSymmetric(distance, edges):
+    n = len(distance)
+    TSP = Model('TSP')
+    x = TSP.addVars(edges, vtype=GRB.BINARY, obj = [distance[i][j] for i, j in edges], name = 'x')
+    TSP.update()
+
+    degree = {}
+    for i in range(n):
+        degree[i] = TSP.addConstr(x.sum(i, '*') + x.sum('*', i) == 2, name='degree_{}'.format(i))
+    return TSP, x, (degree, degree) # rows of edge (i,j) are degree[i] and degree[j]
+
+def loadTSP(TSP, x, rows, distance, symmetric):
+    # Parameters and the data the callback reads, the same for both formulations
+    TSP.modelSense = GRB.MINIMIZE
+    TSP.Params.lazyConstraints = 1
+    TSP.Params.PreCrush = 1 # Allow user cuts
+
+    # Load data into the model
+    TSP._x = x
+    TSP._n = len(distance)
+    TSP._symmetric = symmetric
+    TSP._fractional = True # Separate subtours of node relaxations as user cuts
+    TSP._heuristic = True # Repair node relaxations into tours with cbSetSolution
+    TSP._distance = distance
+    TSP._lastRepair = -1 # Node count of the last repaired relaxation
+    TSP._incumbents = [] # (runtime, objective) of every new incumbent
+    TSP._rows = rows # The two rows every new arc or edge variable enters, see addArcs
+    TSP._subtours = [] # Subtours cut off so far, reused by the pricing LP
+    return TSP
+
+def buildTSP(distance, formulation=ASYMMETRIC, arcs=None):
+    # arcs defaults to every ordered pair, the symmetric model keeps the pairs with i < j
+    n = len(distance)
+    if arcs is None:
+        arcs = [(i, j) for i in range(n) for j in range(n) if i != j]
+    if formulation == ASYMMETRIC:
+        return loadTSP(*buildAsymmetric(distance, arcs), distance, symmetric=False)
+    if formulation == SYMMETRIC:
+        return loadTSP(*buildSymmetric(distance, [(i, j) for i, j in arcs if i < j]), distance, symmetric=True)
+    raise ValueError("Unknown formulation: {}".format(formulation))
+
+def addSubtourConstr(model, component, lazy):
+    model._subtours.append(component)
+    expr = quicksum(model._x[i,j] for i in component for j in component if (i,j) in model._x)
+    if lazy:
+        model.cbLazy(expr <= len(component) - 1)
+    else:
+        model.cbCut(expr <= len(component) - 1)
+
+def subtourelim(model, where):
+    if where == GRB.Callback.MIPSOL:
+        # Integer solution: every connected component short of a tour is a subtour
+        x_sol = model.cbGetSolution(model._x)
+        for component in components(range(model._n), (a for a, value in x_sol.items() if value > 0.5)):
+            if len(component) < model._n:
+                print('Add constraint for subtour: {}'.format(component))
+                addSubtourConstr(model, component, lazy=True)
+    elif where == GRB.Callback.MIPNODE:
+        if model.cbGet(GRB.Callback.MIPNODE_STATUS) != GRB.OPTIMAL:
+            return
+        x_rel = model.cbGetNodeRel(model._x)
+        # Fractional relaxation: min cuts of the support graph below 2
+        if model._fractional:
+            for component in fractionalSubtours(model._n, x_rel):
+                addSubtourConstr(model, component, lazy=False)
+        # Primal heuristic: once per node, submit the repaired tour if it beats the incumbent
+        node = model.cbGet(GRB.Callback.MIPNODE_NODCNT)
+        if model._heuristic and node != model._lastRepair:
+            model._lastRepair = node
+            tour = repairTour(x_rel, model._distance)
+            arcs = solutionArcs(model, tour)
+            if all(a in model._x for a in arcs) and tourLength(tour, model._distance) < model.cbGet(GRB.Callback.MIPNODE_OBJBST) - 1e-6:
+                chosen = set(arcs)
+                model.cbSetSolution(list(model._x.values()), [1.0 if a in chosen else 0.0 for a in model._x.keys()])
+    elif where == GRB.Callback.MIP:
+        best = model.cbGet(GRB.Callback.MIP_OBJBST)
+        if best < GRB.INFINITY and (not model._incumbents or best < model._incumbents[-1][1] - 1e-6):
+            model._incumbents.append((model.cbGet(GRB.Callback.RUNTIME), best))
+
+def solutionArcs(model, tour):
+    # Variables of the model set to one by a tour
+    if model._symmetric:
+        return [(min(i, j), max(i, j)) for i, j in tourArcs(tour)]
+    return tourArcs(tour)
+
+def setStart(model, tour):
+    # MIP start from a tour, every arc of it must be in the model
+    chosen = set(solutionArcs(model, tour))
+    for a, var in model._x.items():
+        var.Start = 1.0 if a in chosen else 0.0
+
+def addArcs(model, distance, newArcs):
+    first, second = model._rows
+    for i, j in newArcs:
+        model._x[i,j] = model.addVar(vtype=GRB.BINARY, obj = distance[i][j], name = 'x[{},{}]'.format(i,j),
+                                     column = Column([1, 1], [first[i], second[j]]))
+
+def solveTSP(model, distance, sparse=False):
+    # Solve with lazy subtour elimination. In sparse mode add back every missing
+    # arc whose reduced cost could still improve the tour and re-solve
+    model.optimize(subtourelim)
+    n = model._n
+    x = model._x
+    while sparse:
+        if model.SolCount == 0:
+            # The K nearest neighbor graph has no tour, fall back to all arcs
+            newArcs = [(i, j) for i in range(n) for j in range(n) if i != j and (i, j) not in x and (i < j or not model._symmetric)]
+        else:
+            newArcs, LB = priceArcs(distance, list(x.keys()), model._subtours, model.objVal, model._symmetric)
+            print('Pricing: LP bound {:.4f}, incumbent {:.4f}, {} arcs to add'.format(LB, model.objVal, len(newArcs)))
+        if not newArcs:
+            break
+        for i, j in x.keys():
+            x[i,j].Start = x[i,j].X if model.SolCount > 0 else GRB.UNDEFINED
+        addArcs(model, distance, newArcs)
+        model.optimize(subtourelim)
+    return model
@@ -1,111 +1,46 @@
 from gurobipy import *
-from math import sqrt
 import matplotlib.pyplot as plt
+import numpy as np
+from Distance import *
+from Heuristics import *
+from Plotting import *
+from TSPModel import *
+
+FORMULATION = ASYMMETRIC # ASYMMETRIC or SYMMETRIC
+SPARSE = False # Only create arcs to the K nearest neighbors, price the rest back in
+K = 10
+HEURISTIC = True # Warm start from a 2-opt/Or-opt tour and repair node relaxations
+PLOT_FILE = None # Write the tour to this file (headless) instead of showing it, e.g. 'TSP.png'
 
 def read(inputfile):
-    f = open(inputfile, 'r')
-    line = f.readline()
-    fields = str.split(line)
-    n = int(fields[0])
-    location = [[] for i in range(n)] # initialize a list of coordinates for each city
-    i = 0
-    for line in f:
-        fields = line.split('\t')
-        loc_x = float(fields[0])
-        loc_y = float(fields[1])
-        location[i] = (loc_x, loc_y)
-        i += 1
-    f.close
-    
-    return location
-
-def calcDistance(location):
-    n = len(location) # number of nodes
-    distance = [[0 for j in range (n)] for i in range(n)] # initialize arc costs
-    for i in range(n):
-        for j in range(i,n):
-            if i < j:
-                x_dist = (location[i][0] - location[j][0])**2
-                y_dist = (location[i][1] - location[j][1])**2
-                dist = sqrt(x_dist + y_dist)
-                distance[i][j] = dist
-                distance[j][i] = dist
-    return distance
+    # First line is the number of cities, then one tab separated coordinate pair per city
+    return np.loadtxt(inputfile, skiprows=1, ndmin=2)
 
 inputfile = '../dat/TSP_instance_n_50_s_0.dat'
 location = read(inputfile) # location of each city
 n = len(location) # number of cities 
 distance = calcDistance(location) # arc costs
 
-TSP = Model('TSP')
-
-x = {}
-for i in range(n):
-    for j in range(n):
-        if i != j:
-            x[i,j] = TSP.addVar(vtype=GRB.BINARY, obj = distance[i][j], name = 'x_{}_{}'.format(i,j))
-            
-TSP.modelSense = GRB.MINIMIZE
-TSP.Params.lazyConstraints = 1
-TSP.update()
-
-for i in range(n):
-    TSP.addConstr(quicksum(x[i,j] for j in range(n) if i != j) == 1, name='leave_{}'.format(i))
-    TSP.addConstr(quicksum(x[j,i] for j in range(n) if i != j) == 1, name='enter_{}'.format(i))
-
-# Load data into the model
-TSP._x = x
-TSP._n = n
-
-def subtourelim(model, where):
-    if where == GRB.Callback.MIPSOL:
-        # Retrieve Current Solution
-        x_sol = model.cbGetSolution(model._x)
-        arcs = tuplelist((i,j) for i,j in model._x.keys() if x_sol[i,j] > 0.5)
-        adjList = [[] for i in range(model._n)]
-        for i, j in arcs:
-            adjList[i].append(j)    
-        # Find connected components
-        found = [0 for i in range(model._n)]
-        components = []
-        #------- Separation Algorithm -------
-        for i in range(model._n):
-            component = []
-            queue = []
-            if found[i] == 0:
-                found[i] = 1
-                component.append(i)
-                queue.append(i)
-                while queue:
-                    v = queue.pop(0)
-                    for u in adjList[v]:
-                        if found[u] == 0:
-                            found[u] = 1
-                            component.append(u)
-                            queue.append(u)
-                components.append(component)
-        # ------- Check connected components -------
-        for component in components:
-            if len(component) < model._n:
-                print('Add constraint for subtour: {}'.format(component))
-                model.cbLazy(quicksum(x[i,j] for i in component for j in component if i !=j) <= len(component) - 1)
-
-TSP.optimize(subtourelim)
-
-def plotSolution(x_sol, location):
-    coord_x = [v[0] for v in location]
-    coord_y = [v[1] for v in location]
-    Arcs = []
+arcs = knnArcs(location, K, distance) if SPARSE else None
+if HEURISTIC:
+    tour = initialTour(distance)
+    print('Heuristic tour length: {:.4f}'.format(tourLength(tour, distance)))
+    if SPARSE:
+        arcs = sorted(set(arcs) | set(tourArcs(tour)) | set((j, i) for i, j in tourArcs(tour)))
+TSP = buildTSP(distance, FORMULATION, arcs)
+TSP._heuristic = HEURISTIC
+if HEURISTIC:
+    setStart(TSP, tour)
+solveTSP(TSP, distance, SPARSE)
+x = TSP._x
+
+def plotSolution(model, location, outputfile=None):
+    arcs = selectedArcs(model, model._x)
+    if outputfile is not None:
+        renderTour(location, arcs, outputfile)
+        return
     plt.clf()
-    for i, j in x_sol.keys():
-        if x_sol[i, j].X > 0.5:
-            plt.plot([coord_x[i], coord_x[j]], [coord_y[i], coord_y[j]], color='b', alpha=0.4,zorder=0)
-    plt.scatter(x=coord_x, y=coord_y, color='r', zorder=1)
-    for i in range(len(location)):
-        plt.annotate(i, (coord_x[i]+0.25,coord_y[i]+0.25))
-    plt.xlim((0,22))
-    plt.ylim((0,22))
-    #plt.savefig('TSP.jpg')
+    drawTour(plt.gca(), location, arcs)
     plt.show()
 
-plotSolution(x, location)
\ No newline at end of file
+plotSolution(TSP, location, PLOT_FILE)
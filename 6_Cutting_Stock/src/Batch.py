@@ -0,0 +1,68 @@
+from gurobipy import *
+from multiprocessing import Pool
+from ColumnGeneration import *
+from Heuristics import *
+from Knapsack import *
+from PatternCache import *
+from Stabilization import *
+import os
+import sys
+import time
+
+# Solves every order file (CSP.txt format) of a directory, or the files named one per
+# line on standard input with '-', in a process pool. Patterns used by earlier orders
+# on the same roll width start the master of later ones
+
+ORDERS = sys.argv[1] if len(sys.argv) > 1 else '../dat' # Directory of *.txt order files or '-'
+CACHE = '../dat/patterns' # Pattern cache directory
+PROCESSES = None # Worker processes, None for one per CPU
+COLUMNS = 5 # Patterns added per master solve
+FINISH = 'ffd' # 'ffd' or 'residual', see Heuristics.py
+SOLVE_IP = True # Restricted master IP when the heuristic leaves a gap
+
+def orderFiles(source):
+    if source == '-':
+        for line in sys.stdin:
+            if line.strip():
+                yield line.strip()
+    else:
+        for name in sorted(os.listdir(source)):
+            if name.endswith('.txt'):
+                yield os.path.join(source, name)
+
+def solveOrder(inputfile):
+    start = time.time()
+    m, W, width, demand = readCSP(inputfile)
+    master, x, orders = buildMaster(W, width, demand)
+    cached = PatternCache(CACHE).applicable(W, width)
+    for pattern in cached:
+        addPattern(master, x, orders, pattern)
+
+    log = []
+    iterations, masterTime, pricingTime = columnGeneration(master, x, orders, makePricer(width, W), verbose=False, columns=COLUMNS,
+                                                           stabilization=makeStabilization('wentges'), earlyStop=True, log=log)
+    bound = lpBound(log)
+    solution = finish(master, x, W, width, demand, FINISH)
+    rolls = sum(count for count, pattern in solution)
+
+    # Patterns of the LP solution and of the heuristic solution go to the cache
+    useful = [byWidth(width, master._patterns[i]) for i in x if x[i].X > 1e-6]
+    useful += [byWidth(width, pattern) for count, pattern in solution]
+    if SOLVE_IP and rolls > bound:
+        solveInteger(master, x, verbose=False)
+        if master.SolCount > 0:
+            rolls = min(rolls, int(round(master.objVal)))
+    return inputfile, W, len(cached), iterations, rolls, bound, time.time() - start, useful
+
+if __name__ == '__main__':
+    cache = PatternCache(CACHE)
+    print('{:<30}{:>8}{:>8}{:>8}{:>8}{:>8}{:>8}{:>10}'.format('Order', 'W', 'Cached', 'Iter', 'Rolls', 'Bound', 'New', 'Time(s)'))
+    start = time.time()
+    solved = 0
+    with Pool(PROCESSES) as pool:
+        for inputfile, W, cached, iterations, rolls, bound, seconds, useful in pool.imap_unordered(solveOrder, orderFiles(ORDERS)):
+            new = cache.add(W, useful)
+            solved += 1
+            print('{:<30}{:>8}{:>8}{:>8}{:>8}{:>8}{:>8}{:>10.3f}'.format(os.path.basename(inputfile), W, cached, iterations, rolls, bound, new, seconds))
+    elapsed = time.time() - start
+    print("{} orders in {:.2f}s, {:.1f} orders per minute".format(solved, elapsed, 60 * solved / elapsed))
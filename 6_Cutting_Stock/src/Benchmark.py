@@ -0,0 +1,60 @@
+from gurobipy import *
+import numpy as np
+from ColumnGeneration import *
+from Knapsack import *
+from Stabilization import *
+
+# Pricing throughput of the DP knapsack against the Gurobi knapsack subproblem
+# on CSP.txt and on random order books, then the column generation loop with and
+# without dual stabilization and early termination
+
+INSTANCES = [(25, 1000), (50, 1000), (50, 10000)] # (items, roll width)
+SEED = 0
+
+def randomOrders(m, W, seed=0):
+    # Widths between 5% and 50% of the roll, demands between 1 and 500
+    rng = np.random.default_rng(seed)
+    width = sorted(rng.choice(np.arange(W // 20, W // 2), size=m, replace=False).tolist(), reverse=True)
+    demand = rng.integers(1, 501, size=m).tolist()
+    return m, W, width, demand
+
+def benchmarkStabilization(W, width, demand, method, earlyStop):
+    master, x, orders = buildMaster(W, width, demand)
+    log = []
+    iterations, masterTime, pricingTime = columnGeneration(master, x, orders, makePricer(width, W), verbose=False,
+                                                           stabilization=makeStabilization(method), earlyStop=earlyStop, log=log)
+    return [iterations, masterTime + pricingTime, log[-1][2], log[-1][3]], log
+
+def benchmark(W, width, demand, method):
+    master, x, orders = buildMaster(W, width, demand)
+    pricer = makePricer(width, W, method)
+    iterations, masterTime, pricingTime = columnGeneration(master, x, orders, pricer, verbose=False)
+    calls = iterations
+    return [calls, pricingTime, 1000 * pricingTime / calls, calls / (masterTime + pricingTime), master.objVal]
+
+instances = [('CSP.txt',) + readCSP('../dat/CSP.txt')]
+instances += [('random_m_{}_W_{}'.format(m, W),) + randomOrders(m, W, SEED) for m, W in INSTANCES]
+
+print('{:<22}{:<8}{:>8}{:>12}{:>14}{:>14}{:>12}'.format('Instance', 'Pricer', 'Calls', 'Pricing(s)', 'ms/call', 'Iter/s', 'LP bound'))
+for name, m, W, width, demand in instances:
+    for method in ['gurobi', 'dp']:
+        row = benchmark(W, width, demand, method)
+        print('{:<22}{:<8}{:>8}{:>12.3f}{:>14.3f}{:>14.1f}{:>12.4f}'.format(name, method, *row))
+
+print()
+print('{:<22}{:<10}{:<7}{:>8}{:>10}{:>12}{:>12}'.format('Instance', 'Stabilize', 'Early', 'Iter', 'Time(s)', 'Master', 'Bound'))
+for name, m, W, width, demand in instances:
+    for method in ['none', 'wentges', 'boxstep']:
+        for earlyStop in [False, True]:
+            row, log = benchmarkStabilization(W, width, demand, method, earlyStop)
+            print('{:<22}{:<10}{:<7}{:>8}{:>10.3f}{:>12.4f}{:>12.4f}'.format(name, method, str(earlyStop), *row))
+
+# Per-iteration bounds on CSP.txt
+name, m, W, width, demand = instances[0]
+for method in ['none', 'wentges', 'boxstep']:
+    row, log = benchmarkStabilization(W, width, demand, method, False)
+    print()
+    print('{} stabilization on {}'.format(method, name))
+    print('{:>6}{:>10}{:>12}{:>12}'.format('Iter', 'Time(s)', 'Master', 'Bound'))
+    for iteration, elapsed, objval, bound in log:
+        print('{:>6}{:>10.3f}{:>12.4f}{:>12.4f}'.format(iteration, elapsed, objval, bound))
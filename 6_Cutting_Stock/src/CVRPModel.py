@@ -0,0 +1,106 @@
+from gurobipy import *
+import math
+import time
+from CapacitySeparation import *
+
+
+def buildCVRP(instance):
+    # Two-index formulation: x[i,j] for i < j, depot edges may be used twice (one customer routes)
+    n = instance.n
+    depot = int(instance.depots[0])
+    edges = [(i, j) for i in range(n) for j in range(i + 1, n)]
+    CVRP = Model('CVRP')
+    x = CVRP.addVars(edges, vtype=GRB.BINARY, obj = [instance.distance[i][j] for i, j in edges], name = 'x')
+    for i, j in edges:
+        if depot in (i, j):
+            x[i,j].vtype = GRB.INTEGER
+            x[i,j].ub = 2
+
+    CVRP.modelSense = GRB.MINIMIZE
+    CVRP.Params.lazyConstraints = 1
+    CVRP.Params.PreCrush = 1 # Allow user cuts
+    CVRP.update()
+
+    trucks = max(instance.trucks or 0, math.ceil(instance.demand.sum() / instance.capacity))
+    for i in range(n):
+        if i == depot:
+            CVRP.addConstr(x.sum(i, '*') + x.sum('*', i) >= 2 * trucks, name='depot')
+        else:
+            CVRP.addConstr(x.sum(i, '*') + x.sum('*', i) == 2, name='degree_{}'.format(i))
+
+    # Load data into the model
+    CVRP._x = x
+    CVRP._n = n
+    CVRP._depot = depot
+    CVRP._demand = instance.demand
+    CVRP._capacity = instance.capacity
+    CVRP._fractional = True # Separate fractional node relaxations as user cuts
+    CVRP._cuts = 0
+    CVRP._cutSets = set() # Sets already added as user cuts
+    CVRP._separationTime = 0.0
+    CVRP._rootBound = None # Bound of the root node after the last round of cuts
+    return CVRP
+
+def addCapacityConstr(model, S, lazy):
+    # x(delta(S)) >= 2 ceil(d(S) / Q)
+    model._cuts += 1
+    inside = set(S)
+    expr = quicksum(var for (i, j), var in model._x.items() if (i in inside) != (j in inside))
+    rhs = 2 * math.ceil(model._demand[S].sum() / model._capacity - EPS)
+    if lazy:
+        model.cbLazy(expr >= rhs)
+    else:
+        model.cbCut(expr >= rhs)
+
+def capacityCuts(model, where):
+    if where == GRB.Callback.MIPSOL:
+        # Integer solution: components without the depot or over capacity
+        start = time.time()
+        x_sol = model.cbGetSolution(model._x)
+        sets = capacityCutSets(model._n, x_sol, model._demand, model._capacity, model._depot, fractional=False)
+        model._separationTime += time.time() - start
+        for S in sets:
+            addCapacityConstr(model, S, lazy=True)
+    elif where == GRB.Callback.MIPNODE:
+        if model.cbGet(GRB.Callback.MIPNODE_STATUS) != GRB.OPTIMAL:
+            return
+        if model.cbGet(GRB.Callback.MIPNODE_NODCNT) == 0:
+            model._rootBound = max(model._rootBound or -GRB.INFINITY, model.cbGet(GRB.Callback.MIPNODE_OBJBND))
+        if model._fractional:
+            start = time.time()
+            x_rel = model.cbGetNodeRel(model._x)
+            sets = capacityCutSets(model._n, x_rel, model._demand, model._capacity, model._depot)
+            model._separationTime += time.time() - start
+            for S in sets:
+                if frozenset(S) not in model._cutSets:
+                    model._cutSets.add(frozenset(S))
+                    addCapacityConstr(model, S, lazy=False)
+
+def setStart(model, routes):
+    # MIP start from routes (depot, ..., depot)
+    count = {}
+    for route in routes:
+        for i, j in zip(route[:-1], route[1:]):
+            count[min(i, j), max(i, j)] = count.get((min(i, j), max(i, j)), 0) + 1
+    for e, var in model._x.items():
+        var.Start = count.get(e, 0)
+
+def routes(model):
+    # Routes (depot, ..., depot) of the incumbent
+    depot = model._depot
+    neighbors = {i: [] for i in range(model._n)}
+    for (i, j), var in model._x.items():
+        for k in range(int(round(var.X))):
+            neighbors[i].append(j)
+            neighbors[j].append(i)
+    found = []
+    while neighbors[depot]:
+        route = [depot, neighbors[depot].pop()]
+        neighbors[route[-1]].remove(depot)
+        while route[-1] != depot:
+            i = route[-1]
+            j = neighbors[i].pop()
+            neighbors[j].remove(i)
+            route.append(j)
+        found.append(route)
+    return found
@@ -0,0 +1,88 @@
+import math
+import numpy as np
+
+EPS = 1e-6
+
+
+def find(parent, i):
+    # Root of i with path halving
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def components(nodes, edges):
+    # Connected components of the graph on nodes with the given edges (union-find). The same
+    # helper is in 5_TSP/src/SubtourSeparation.py, keep the two alike
+    parent = {i: i for i in nodes}
+    for i, j in edges:
+        ri, rj = find(parent, i), find(parent, j)
+        if ri != rj:
+            parent[ri] = rj
+    groups = {}
+    for i in nodes:
+        groups.setdefault(find(parent, i), []).append(i)
+    return list(groups.values())
+
+def supportWeights(n, x_sol):
+    # Symmetric n x n matrix with w_ij = x_ij for the edge variables
+    W = np.zeros((n, n))
+    for (i, j), value in x_sol.items():
+        if value > EPS:
+            W[i, j] += value
+            W[j, i] += value
+    return W
+
+def capacityViolation(W, S, demand, capacity):
+    # 2 ceil(d(S) / Q) - x(delta(S)), positive when the rounded capacity inequality of S is violated
+    inside = np.zeros(len(W), dtype=bool)
+    inside[S] = True
+    return 2 * math.ceil(demand[S].sum() / capacity - EPS) - W[inside][:, ~inside].sum()
+
+def shrinkingHeuristic(W, customers, demand, capacity):
+    # Customers joined by edges at one are shrunk into a single vertex, then every shrunk
+    # vertex grows a set by adding the neighbor with the largest weight to the set.
+    # Cut values are updated incrementally on the shrunk graph
+    groups = components(customers, [(i, j) for i in customers for j in customers if i < j and W[i, j] >= 1 - EPS])
+    P = np.zeros((len(W), len(groups)))
+    for a, group in enumerate(groups):
+        P[group, a] = 1
+    G = P.T @ W @ P
+    leaving = P.T @ W.sum(axis=1) - np.diag(G) # x(delta(group))
+    np.fill_diagonal(G, 0)
+    groupDemand = P.T @ demand
+    found = []
+    for seed in range(len(groups)):
+        chosen = [seed]
+        cut = leaving[seed]
+        load = groupDemand[seed]
+        attach = G[seed].copy()
+        attach[seed] = -1
+        while True:
+            if 2 * math.ceil(load / capacity - EPS) - cut > EPS:
+                found.append([i for a in chosen for i in groups[a]])
+            b = int(np.argmax(attach))
+            if attach[b] <= EPS:
+                break
+            chosen.append(b)
+            cut += leaving[b] - 2 * attach[b]
+            load += groupDemand[b]
+            attach += G[b]
+            attach[chosen] = -1
+    return found
+
+def capacityCutSets(n, x_sol, demand, capacity, depot=0, fractional=True):
+    # Customer sets with a violated rounded capacity inequality: the connected components
+    # of the support graph without the depot and, for fractional points, the sets of the
+    # shrinking heuristic
+    demand = np.asarray(demand)
+    W = supportWeights(n, x_sol)
+    customers = [i for i in range(n) if i != depot]
+    candidates = components(customers, [(i, j) for i in customers for j in customers if i < j and W[i, j] > EPS])
+    if fractional:
+        candidates += shrinkingHeuristic(W, customers, demand, capacity)
+    found = {}
+    for S in candidates:
+        if capacityViolation(W, S, demand, capacity) > EPS:
+            found.setdefault(frozenset(S), sorted(S))
+    return list(found.values())
@@ -0,0 +1,161 @@
+from gurobipy import *
+import math
+import time
+from Stabilization import *
+
+
+def readCSP(inputfile):
+    f = open(inputfile, 'r')
+    line = f.readline()
+    fields = str.split(line)
+    m = int(fields[0])
+    W = int(fields[1])
+    width = []
+    demand = []
+    for line in f:
+        fields = line.split()
+        if not fields:
+            continue
+        s = int(fields[0])
+        d = int(fields[1])
+        width.append(s)
+        demand.append(d)
+
+    f.close()
+    return m, W, width, demand
+
+def buildMaster(W, width, demand):
+    # Restricted master with the trivial pattern floor(W/width_j) of every item
+    m = len(width)
+    master = Model('Cutting-Stock')
+    x = {}
+    for i in range(m):
+        x[i] = master.addVar(vtype=GRB.CONTINUOUS, obj = 1, name="x_{}".format(i))
+    master.setParam("OutputFlag", 0)
+    master.update()
+    master.modelSense = GRB.MINIMIZE
+
+    orders = {} # Place Constraints in dictionary
+    for j in range(m):
+        orders[j] = master.addConstr(math.floor(W/float(width[j]))*x[j]  >= demand[j])
+
+    # Pattern of every column, keys of x stay unique when columns are removed
+    master._patterns = {}
+    for i in range(m):
+        master._patterns[i] = [math.floor(W/float(width[j])) if j == i else 0 for j in range(m)]
+    master._nextColumn = m
+    master.update()
+    return master, x, orders
+
+def addPattern(master, x, orders, pattern, key=None):
+    if key is None:
+        key = master._nextColumn
+        master._nextColumn += 1
+    rows = [j for j in range(len(pattern)) if pattern[j] > 0]
+    x[key] = master.addVar(vtype=GRB.CONTINUOUS, obj = 1, name="x_{}".format(key),
+                           column = Column([pattern[j] for j in rows], [orders[j] for j in rows]))
+    master._patterns[key] = list(pattern)
+    return x[key]
+
+def printMasterSol(master, x, iteration):
+    print("-----------")
+    print("Iteration: {}".format(iteration))
+    print("-----------")
+    print("Rolls used: {}".format(master.objval))
+    for i in x:
+        if x[i].X > 0:
+            print("{} = {}".format(x[i].VarName, x[i].x))
+    print("-----------")
+
+def printDualSol(value, pattern):
+    print("New column found with reduced cost {}".format(1 - value))
+    for j in range(len(pattern)):
+        if pattern[j] > 0:
+            print("{} rolls of item {}".format(pattern[j], j))
+
+def lagrangianBound(demand, pi, value):
+    # Any pi >= 0 scaled by the best pattern value is dual feasible (Farley bound)
+    return sum(d * p for d, p in zip(demand, pi)) / max(value, 1)
+
+def printBounds(iteration, elapsed, objval, bound):
+    print("Iteration {}: {:.3f}s, master {:.4f}, Lagrangian bound {:.4f}".format(iteration, elapsed, objval, bound))
+
+def columnGeneration(master, x, orders, pricer, verbose=True, columns=1, pool=None,
+                     stabilization=None, earlyStop=False, log=None):
+    # Add up to `columns` patterns with negative reduced cost per master solve until
+    # there are none. With a ColumnPool, long non-basic columns are moved to the
+    # pool and pool columns that price out are added back before pricing.
+    # A Stabilization object chooses the dual vectors to price at. Every pricing call
+    # gives a Lagrangian bound, and with earlyStop the loop ends once the rounded up
+    # bound reaches the rounded up master objective, which no more columns can lower.
+    # (iteration, seconds, master objective, bound) is appended to log every iteration.
+    # Returns the number of master solves and the time spent in the master and in pricing
+    m = len(orders)
+    demand = [orders[j].RHS for j in range(m)]
+    if stabilization is None:
+        stabilization = Stabilization()
+    stabilization.setup(master, orders)
+    bound = 0.0
+    iterations = 0
+    masterTime = 0.0
+    pricingTime = 0.0
+    begin = time.time()
+    while True:
+        start = time.time()
+        master.optimize()
+        masterTime += time.time() - start
+        iterations += 1
+        if verbose:
+            printMasterSol(master, x, iterations)
+        pi = [orders[j].Pi for j in range(m)]
+
+        start = time.time()
+        if pool is not None:
+            pool.update(master, x, protected=range(m))
+            revived = pool.reprice(pi)
+            if revived:
+                for key, pattern in revived:
+                    addPattern(master, x, orders, pattern, key)
+                pricingTime += time.time() - start
+                continue
+        for price in stabilization.candidates(pi):
+            if columns > 1:
+                patterns = pricer.priceMany(price, columns)
+            else:
+                patterns = [pricer.price(price)]
+            value = max(value for value, pattern in patterns)
+            candidate = lagrangianBound(demand, price, value)
+            bound = max(bound, candidate)
+            stabilization.feedback(price, candidate)
+            # Keep the patterns that price out at the master duals, none is a mispricing
+            patterns = [(value, pattern) for value, pattern in patterns
+                        if sum(p * a for p, a in zip(pi, pattern)) > 1 + 1e-6]
+            if patterns:
+                break
+        pricingTime += time.time() - start
+        if log is not None:
+            log.append((iterations, time.time() - begin, master.objval, bound))
+        if verbose:
+            printBounds(iterations, time.time() - begin, master.objval, bound)
+        if not patterns:
+            if stabilization.converged(master, pi):
+                break
+            continue
+        if earlyStop and stabilization.exact(master) and math.ceil(bound - 1e-6) >= math.ceil(master.objval - 1e-6):
+            if verbose:
+                print("Lagrangian bound closes the rounding gap, stopping early")
+            break
+        for value, pattern in patterns:
+            if verbose:
+                printDualSol(value, pattern)
+            addPattern(master, x, orders, pattern)
+    stabilization.teardown(master)
+    return iterations, masterTime, pricingTime
+
+def solveInteger(master, x, verbose=True):
+    # Solve the restricted master with integer pattern counts
+    master.setParam("OutputFlag", 1 if verbose else 0)
+    for i in x:
+        x[i].vtype = GRB.INTEGER
+    master.update()
+    master.optimize()
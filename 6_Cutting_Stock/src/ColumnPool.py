@@ -0,0 +1,38 @@
+from gurobipy import *
+
+
+class ColumnPool:
+    # Columns that stayed non-basic for more than maxAge master solves are removed
+    # from the master and kept here, and come back once their reduced cost
+    # 1 - sum(pi_j a_j) is negative again. maxColumns optionally caps the number
+    # of columns in the master (the oldest non-basic ones are removed first)
+
+    def __init__(self, maxAge=20, maxColumns=None):
+        self.maxAge = maxAge
+        self.maxColumns = maxColumns
+        self.age = {} # master column -> consecutive non-basic solves
+        self.patterns = {} # removed column -> pattern
+        self.removed = 0
+        self.revived = 0
+
+    def update(self, master, x, protected=()):
+        # Call after each master solve, columns in protected are never removed
+        keys = [i for i in x if i not in protected]
+        basis = master.getAttr('VBasis', [x[i] for i in keys])
+        for i, b in zip(keys, basis):
+            self.age[i] = 0 if b == GRB.BASIC else self.age.get(i, 0) + 1
+        old = [i for i in keys if self.age[i] > self.maxAge]
+        if self.maxColumns is not None and len(x) - len(old) > self.maxColumns:
+            rest = sorted((i for i in keys if 0 < self.age[i] <= self.maxAge), key=lambda i: -self.age[i])
+            old += rest[:len(x) - len(old) - self.maxColumns]
+        for i in old:
+            self.patterns[i] = master._patterns.pop(i)
+            master.remove(x.pop(i))
+            del self.age[i]
+        self.removed += len(old)
+
+    def reprice(self, pi):
+        # Removed columns with negative reduced cost, taken out of the pool
+        found = [i for i, pattern in self.patterns.items() if sum(pi[j] * a for j, a in enumerate(pattern)) > 1 + 1e-6]
+        self.revived += len(found)
+        return [(i, self.patterns.pop(i)) for i in found]
@@ -1,102 +1,33 @@
 from gurobipy import *
-import math
-
-def read(inputfile):
-        f = open(inputfile, 'r')
-        line = f.readline()
-        fields = str.split(line)
-        m = int(fields[0])
-        W = int(fields[1])
-        width = []
-        demand = []
-        for line in f:
-            fields = line.split(' ')
-            s = int(fields[0])
-            d = int(fields[1])
-            width.append(s)
-            demand.append(d)
-
-        f.close
-        return m, W, width, demand
-
-
-m, W, width, demand =  read("../dat/CSP.txt")
-
-master = Model('Cutting-Stock')
-n = m
-x = {}
-for i in range(n):
-    x[i] = master.addVar(vtype=GRB.CONTINUOUS, obj = 1, name="x_{}".format(i))
-master.setParam("OutputFlag", 0)
-master.update()
-master.modelSense = GRB.MINIMIZE
-
-orders = {} # Place Constraints in dictionary
-pi = [] # Dual Values
-for j in range(m):
-    pi.append(0)
-    orders[j] = master.addConstr(math.floor(W/float(width[j]))*x[j]  >= demand[j])
-
-
-def printMasterSol(master, x, n, m):
-    print("-----------")
-    print("Iteration: {}".format(n - m))
-    print("-----------")
-    print("Rolls used: {}".format(master.objval))
-    for i in range(n):
-        if x[i].X > 0:
-            print("{} = {}".format(x[i].VarName, x[i].x))
-    print("-----------")
-
-def printDualSol(subproblem, y, m):
-    print("New column found with reduced cost {}".format(1 - subproblem.objval))
-    for j in range(m):
-        if y[j].X > 0:
-            print("{} rolls of item {}".format(y[j].X, j))
-
-
-
-subproblem = Model("Knapsack")
-y = {}
-for j in range(m):
-    y[j] = subproblem.addVar(vtype=GRB.INTEGER, name="y_{}".format(j))
-
-subproblem.setParam("OutputFlag", 0)
-subproblem.modelSense = GRB.MAXIMIZE
-subproblem.addConstr(quicksum(width[j]*y[j] for j in range(m)) <= W)
-subproblem.update()
-
-master.optimize()
-printMasterSol(master, x, n, m)
-
-for j in range(m):
-    print(orders[j].Pi)
-    y[j].Obj = orders[j].Pi
-
-subproblem.optimize()
-printDualSol(subproblem, y, m)
-
-while(subproblem.objval > 1):
-    printDualSol(subproblem, y, m)
-    
-    x[n] = master.addVar(vtype=GRB.CONTINUOUS, obj = 1, name="x_{}".format(n))
-    master.update()
-    
-    for i in range(m):
-        if y[i].x > 0.1:
-            master.chgCoeff(orders[i], x[n], y[i].x)
-    
-    master.optimize()
-    n += 1
-    printMasterSol(master, x, n, m)
-    
-    for i in range(m):
-        y[i].Obj = orders[i].Pi
-    
-    subproblem.optimize()
-
-master.setParam("OutputFlag", 1)
-for i in range(n):
-    x[i].vtype = GRB.INTEGER
-master.update()
-master.optimize()
\ No newline at end of file
+from ColumnGeneration import *
+from ColumnPool import *
+from Heuristics import *
+from Knapsack import *
+from Stabilization import *
+
+PRICING = 'dp' # 'dp' (dynamic programming, Gurobi for very large W) or 'gurobi'
+COLUMNS = 5 # Patterns added per master solve
+MAX_AGE = 20 # Master solves a column may stay non-basic before it moves to the pool
+STABILIZATION = 'wentges' # 'none', 'wentges' (dual smoothing) or 'boxstep'
+EARLY_STOP = True # Stop once the Lagrangian bound closes the gap to the rounded up LP bound
+FINISH = 'ffd' # Completes the rounded down LP solution: 'ffd' (first-fit decreasing) or 'residual' (column generation)
+
+m, W, width, demand = readCSP("../dat/CSP.txt")
+
+master, x, orders = buildMaster(W, width, demand)
+pricer = makePricer(width, W, PRICING)
+pool = ColumnPool(MAX_AGE)
+log = []
+
+iterations, masterTime, pricingTime = columnGeneration(master, x, orders, pricer, columns=COLUMNS, pool=pool,
+                                                       stabilization=makeStabilization(STABILIZATION), earlyStop=EARLY_STOP, log=log)
+print("{} master solves, master {:.3f}s, pricing {:.3f}s".format(iterations, masterTime, pricingTime))
+print("{} columns in the master, {} moved to the pool, {} revived".format(len(x), pool.removed, pool.revived))
+
+bound = lpBound(log)
+solution = finish(master, x, W, width, demand, FINISH)
+printSolution(solution, bound)
+
+# The restricted master IP only when the heuristic may not be optimal
+if sum(count for count, pattern in solution) > bound:
+    solveInteger(master, x)
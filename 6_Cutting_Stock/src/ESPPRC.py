@@ -0,0 +1,135 @@
+import heapq
+import numpy as np
+
+NG = 8 # Size of the ng-neighborhoods (nearest customers a route remembers)
+
+
+class LabelingPricer:
+    # Bidirectional labeling for the shortest path problem with a capacity resource
+    # under the ng-route relaxation: a path may only revisit customer j if it went
+    # through a customer that does not have j in its ng-neighborhood since the last visit.
+    # Forward labels start at the depot and are extended while their load is at most
+    # half the capacity, backward labels (the same ones for symmetric distances) do the
+    # same from the other end of the route, and routes are found by joining the two.
+    # Labels are kept in flat lists (node, cost, load, memory bitmask, parent)
+
+    def __init__(self, distance, demand, capacity, ng=NG, depot=0):
+        self.distance = np.asarray(distance, dtype=float)
+        self.demand = [int(d) for d in demand]
+        self.capacity = int(capacity)
+        self.depot = depot
+        self.n = len(self.demand)
+        self.customers = [i for i in range(self.n) if i != depot]
+        self.symmetric = np.allclose(self.distance, self.distance.T)
+        self.ngMask = [0] * self.n
+        for i in self.customers:
+            near = [j for j in np.argsort(self.distance[i], kind='stable') if j != depot and j != i][:ng - 1]
+            self.ngMask[i] = sum(1 << int(j) for j in near) | (1 << i)
+        self.calls = 0
+        self.created = 0
+        self.dominated = 0
+
+    def label(self, cost):
+        # Labels from the depot over the reduced arc costs, grouped by their last node
+        node = [self.depot]
+        value = [0.0]
+        load = [0]
+        memory = [0]
+        parent = [-1]
+        alive = [True]
+        atNode = [[] for i in range(self.n)]
+        half = self.capacity // 2
+        buckets = [[] for q in range(half + 1)]
+        buckets[0].append(0)
+        for q in range(half + 1):
+            for l in buckets[q]:
+                if not alive[l]:
+                    continue
+                i = node[l]
+                for j in self.customers:
+                    newLoad = load[l] + self.demand[j]
+                    if j == i or (memory[l] >> j) & 1 or newLoad > self.capacity:
+                        continue
+                    newCost = value[l] + cost[i, j]
+                    newMemory = (memory[l] & self.ngMask[j]) | (1 << j)
+                    self.created += 1
+                    if any(value[k] <= newCost + 1e-9 and load[k] <= newLoad and memory[k] & ~newMemory == 0 for k in atNode[j]):
+                        self.dominated += 1
+                        continue
+                    survivors = []
+                    for k in atNode[j]:
+                        if newCost <= value[k] and newLoad <= load[k] and newMemory & ~memory[k] == 0:
+                            alive[k] = False
+                            self.dominated += 1
+                        else:
+                            survivors.append(k)
+                    new = len(node)
+                    node.append(j)
+                    value.append(newCost)
+                    load.append(newLoad)
+                    memory.append(newMemory)
+                    parent.append(l)
+                    alive.append(True)
+                    survivors.append(new)
+                    atNode[j] = survivors
+                    if newLoad <= half:
+                        buckets[newLoad].append(new)
+        atNode[self.depot] = [0]
+        return node, value, load, memory, parent, atNode
+
+    def path(self, labels, l):
+        node, parent = labels[0], labels[4]
+        nodes = []
+        while l >= 0:
+            nodes.append(node[l])
+            l = parent[l]
+        return nodes[::-1]
+
+    def price(self, pi, k=1):
+        # Up to k routes (depot, ..., depot) with the most negative reduced cost,
+        # pi holds the duals of the customers (pi[depot] is ignored)
+        self.calls += 1
+        pi = np.array(pi, dtype=float)
+        pi[self.depot] = 0
+        forward = self.label(self.distance - pi[None, :])
+        backward = forward if self.symmetric else self.label(self.distance.T - pi[None, :])
+        fValue, fLoad, fMemory = forward[1], forward[2], forward[3]
+        bValue, bLoad, bMemory = backward[1], backward[2], backward[3]
+        fOrdered = [sorted(labels, key=lambda l: fValue[l]) for labels in forward[5]]
+        bOrdered = [sorted(labels, key=lambda l: bValue[l]) for labels in backward[5]]
+
+        # The best joins in a heap of (-reduced cost, forward, backward), routes found
+        # from both ends or at several join points are removed afterwards
+        size = 4 * k
+        best = []
+        for i in self.customers:
+            for j in range(self.n):
+                if j == i or not bOrdered[j]:
+                    continue
+                for l in fOrdered[i]:
+                    threshold = -best[0][0] if len(best) == size else -1e-6
+                    bound = threshold - fValue[l] - self.distance[i, j]
+                    if bValue[bOrdered[j][0]] >= bound:
+                        break
+                    for m in bOrdered[j]:
+                        if bValue[m] >= bound:
+                            break
+                        if fLoad[l] + bLoad[m] <= self.capacity and fMemory[l] & bMemory[m] == 0:
+                            item = (-(fValue[l] + self.distance[i, j] + bValue[m]), l, m)
+                            if len(best) < size:
+                                heapq.heappush(best, item)
+                            else:
+                                heapq.heapreplace(best, item)
+                            threshold = -best[0][0] if len(best) == size else -1e-6
+                            bound = threshold - fValue[l] - self.distance[i, j]
+
+        routes = {}
+        for negative, l, m in sorted(best, reverse=True):
+            route = self.path(forward, l) + self.path(backward, m)[::-1]
+            key = min(tuple(route), tuple(route[::-1])) if self.symmetric else tuple(route)
+            routes.setdefault(key, -negative)
+        return [(reducedCost, list(route)) for route, reducedCost in list(routes.items())[:k]]
+
+    def printStatistics(self):
+        print("{} pricing calls, {} labels created, {} dominated ({:.1f}%)".format(
+            self.calls, self.created, self.dominated, 100.0 * self.dominated / max(self.created, 1)))
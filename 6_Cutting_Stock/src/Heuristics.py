@@ -0,0 +1,88 @@
+from gurobipy import *
+from ColumnGeneration import *
+from Knapsack import *
+import math
+
+
+def lpBound(log):
+    # Rounded up Lagrangian bound of the last column generation iteration
+    return math.ceil(log[-1][3] - 1e-6)
+
+def residualDemand(demand, solution):
+    produced = [0] * len(demand)
+    for count, pattern in solution:
+        for j in range(len(pattern)):
+            produced[j] += count * pattern[j]
+    return [max(d - p, 0) for d, p in zip(demand, produced)]
+
+def roundDown(master, x):
+    # (floor(x_i), pattern_i) for every column used at least once in the LP solution
+    master.optimize()
+    solution = []
+    for i in x:
+        if x[i].X >= 1 - 1e-6:
+            solution.append((math.floor(x[i].X + 1e-6), master._patterns[i]))
+    return solution
+
+def firstFitDecreasing(W, width, demand):
+    # Pieces sorted by decreasing width, each one in the first roll it fits in
+    rolls = [] # [remaining width, pattern]
+    for j in sorted(range(len(width)), key=lambda j: -width[j]):
+        for k in range(demand[j]):
+            for roll in rolls:
+                if roll[0] >= width[j]:
+                    break
+            else:
+                roll = [W, [0] * len(width)]
+                rolls.append(roll)
+            roll[0] -= width[j]
+            roll[1][j] += 1
+    patterns = {}
+    for remaining, pattern in rolls:
+        patterns[tuple(pattern)] = patterns.get(tuple(pattern), 0) + 1
+    return [(count, list(pattern)) for pattern, count in patterns.items()]
+
+def residualColumnGeneration(W, width, demand, method='dp'):
+    # Column generation on the residual items only, with pattern counts bounded by the
+    # residual demand. The LP is rounded down, and when every column is fractional the
+    # largest one is rounded up, until no demand is left
+    solution = []
+    residual = list(demand)
+    while sum(residual) > 0:
+        items = [j for j in range(len(width)) if residual[j] > 0]
+        subWidth = [width[j] for j in items]
+        subDemand = [residual[j] for j in items]
+        master, x, orders = buildMaster(W, subWidth, subDemand)
+        columnGeneration(master, x, orders, makePricer(subWidth, W, method, bound=subDemand), verbose=False)
+        found = roundDown(master, x)
+        if not found:
+            i = max(x, key=lambda i: x[i].X)
+            found = [(1, master._patterns[i])]
+        for count, pattern in found:
+            full = [0] * len(width)
+            for k, j in enumerate(items):
+                full[j] = pattern[k]
+            solution.append((count, full))
+        residual = residualDemand(demand, solution)
+    return solution
+
+def finish(master, x, W, width, demand, method='ffd'):
+    # Rounded down LP solution completed with 'ffd' (first-fit decreasing) or
+    # 'residual' (residual column generation)
+    solution = roundDown(master, x)
+    residual = residualDemand(demand, solution)
+    if method == 'ffd':
+        solution += firstFitDecreasing(W, width, residual)
+    elif method == 'residual':
+        solution += residualColumnGeneration(W, width, residual)
+    else:
+        raise ValueError("Unknown finishing heuristic: {}".format(method))
+    return solution
+
+def printSolution(solution, bound):
+    rolls = sum(count for count, pattern in solution)
+    print("-----------")
+    print("Rolls used: {}, rounded up LP bound: {}, gap: {}".format(rolls, bound, rolls - bound))
+    for count, pattern in solution:
+        print("{} rolls cut as {}".format(count, {j: a for j, a in enumerate(pattern) if a > 0}))
+    print("-----------")
@@ -0,0 +1,109 @@
+from gurobipy import *
+import numpy as np
+
+DP_LIMIT = 10**8 # Largest (W + 1) * (number of 0/1 items) solved by dynamic programming
+
+
+class DPKnapsack:
+    # Bounded integer knapsack max sum(pi_j y_j) s.t. sum(width_j y_j) <= W,
+    # 0 <= y_j <= bound_j, solved by dynamic programming over the integer capacities.
+    # Item j is split into 0/1 items of 1, 2, 4, ... copies (binary splitting)
+
+    def __init__(self, width, W, bound=None):
+        self.width = [int(w) for w in width]
+        self.W = int(W)
+        if bound is None:
+            bound = [self.W // w for w in self.width]
+        self.item = [] # original item of every 0/1 item
+        self.copies = []
+        for j, b in enumerate(bound):
+            k = 1
+            while b > 0:
+                self.item.append(j)
+                self.copies.append(min(k, b))
+                b -= min(k, b)
+                k *= 2
+        self.weight = [self.width[j] * c for j, c in zip(self.item, self.copies)]
+
+    def size(self):
+        return (self.W + 1) * len(self.item)
+
+    def price(self, pi):
+        # Returns the best value and the pattern (copies of every item)
+        dp = np.zeros(self.W + 1)
+        take = np.zeros((len(self.item), self.W + 1), dtype=bool)
+        for k, (j, c, w) in enumerate(zip(self.item, self.copies, self.weight)):
+            value = pi[j] * c
+            if value <= 0 or w > self.W:
+                continue
+            candidate = dp[:self.W+1-w] + value
+            better = candidate > dp[w:]
+            take[k, w:] = better
+            dp[w:][better] = candidate[better]
+        pattern = [0] * len(self.width)
+        capacity = self.W
+        for k in range(len(self.item) - 1, -1, -1):
+            if take[k, capacity]:
+                pattern[self.item[k]] += self.copies[k]
+                capacity -= self.weight[k]
+        return dp[self.W], pattern
+
+    def priceMany(self, pi, k):
+        # Up to k distinct patterns worth more than 1: the best one, then the best
+        # pattern without each of its items in turn (most valuable item first)
+        value, best = self.price(pi)
+        patterns = {tuple(best): value}
+        for j in sorted((j for j in range(len(best)) if best[j] > 0), key=lambda j: -pi[j]):
+            if len(patterns) >= k:
+                break
+            reduced = list(pi)
+            reduced[j] = 0
+            value, pattern = self.price(reduced)
+            if value > 1 + 1e-6:
+                patterns.setdefault(tuple(pattern), value)
+        return [(value, list(pattern)) for pattern, value in patterns.items()]
+
+
+class GurobiKnapsack:
+    # The integer knapsack subproblem solved by Gurobi
+
+    def __init__(self, width, W, bound=None):
+        self.subproblem = Model("Knapsack")
+        self.y = {}
+        for j in range(len(width)):
+            self.y[j] = self.subproblem.addVar(vtype=GRB.INTEGER, ub=GRB.INFINITY if bound is None else bound[j], name="y_{}".format(j))
+
+        self.subproblem.setParam("OutputFlag", 0)
+        # Solved to optimality: the column generation bound divides by this value, a smaller one
+        # would overstate the bound and stop early
+        self.subproblem.setParam("MIPGap", 0)
+        self.subproblem.modelSense = GRB.MAXIMIZE
+        self.subproblem.addConstr(quicksum(width[j]*self.y[j] for j in range(len(width))) <= W)
+        self.subproblem.update()
+
+    def price(self, pi):
+        for j in self.y:
+            self.y[j].Obj = pi[j]
+        self.subproblem.optimize()
+        return self.subproblem.objval, [int(round(self.y[j].x)) for j in self.y]
+
+    def priceMany(self, pi, k):
+        # Up to k patterns from the solution pool of the knapsack subproblem
+        self.subproblem.Params.PoolSolutions = k
+        value, pattern = self.price(pi)
+        patterns = [(value, pattern)]
+        for s in range(1, self.subproblem.SolCount):
+            self.subproblem.Params.SolutionNumber = s
+            patterns.append((self.subproblem.PoolObjVal, [int(round(self.y[j].Xn)) for j in self.y]))
+        return patterns
+
+
+def makePricer(width, W, method='dp', bound=None):
+    # 'dp' falls back to Gurobi when the DP table would be too large
+    if method == 'dp':
+        pricer = DPKnapsack(width, W, bound)
+        if pricer.size() <= DP_LIMIT:
+            return pricer
+    elif method != 'gurobi':
+        raise ValueError("Unknown pricing method: {}".format(method))
+    return GurobiKnapsack(width, W, bound)
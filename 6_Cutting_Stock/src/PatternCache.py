@@ -0,0 +1,73 @@
+import os
+
+MAX_PATTERNS = 5000 # Patterns kept per roll width, the most recently useful ones
+
+
+class PatternCache:
+    # Patterns that were used in earlier orders, one file per roll width in directory.
+    # A pattern is stored by item widths ({width: pieces}) so it applies to any later
+    # order on the same roll that has all of its widths
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, W):
+        return os.path.join(self.directory, "W_{}.patterns".format(W))
+
+    def load(self, W):
+        patterns = []
+        if not os.path.exists(self.path(W)):
+            return patterns
+        f = open(self.path(W), 'r')
+        for line in f:
+            fields = line.split()
+            if fields:
+                patterns.append({int(w): int(a) for w, a in (field.split(':') for field in fields)})
+        f.close()
+        return patterns
+
+    def save(self, W, patterns):
+        # Written to a temporary file first, workers never see a half written cache
+        f = open(self.path(W) + '.tmp', 'w')
+        for pattern in patterns[-MAX_PATTERNS:]:
+            f.write(' '.join('{}:{}'.format(w, a) for w, a in sorted(pattern.items())) + '\n')
+        f.close()
+        os.replace(self.path(W) + '.tmp', self.path(W))
+
+    def add(self, W, patterns):
+        # Moves patterns to the end of the cache (most recent), returns the number of new ones
+        cached = self.load(W)
+        keys = {tuple(sorted(p.items())): p for p in cached}
+        new = 0
+        for pattern in patterns:
+            key = tuple(sorted(pattern.items()))
+            if key not in keys:
+                new += 1
+            keys.pop(key, None)
+            keys[key] = pattern
+        self.save(W, list(keys.values()))
+        return new
+
+    def applicable(self, W, width):
+        # Cached patterns of roll W as pattern vectors over the items of this order
+        index = {}
+        for j, w in enumerate(width):
+            index.setdefault(w, j)
+        patterns = []
+        for pattern in self.load(W):
+            if all(w in index for w in pattern) and sum(w * a for w, a in pattern.items()) <= W:
+                vector = [0] * len(width)
+                for w, a in pattern.items():
+                    vector[index[w]] = a
+                patterns.append(vector)
+        return patterns
+
+
+def byWidth(width, pattern):
+    # {width: pieces} of a pattern vector, items of equal width are merged
+    pieces = {}
+    for j, a in enumerate(pattern):
+        if a > 0:
+            pieces[width[j]] = pieces.get(width[j], 0) + a
+    return pieces
@@ -0,0 +1,83 @@
+from gurobipy import *
+import time
+
+
+def routeCost(distance, route):
+    return sum(distance[route[k], route[k + 1]] for k in range(len(route) - 1))
+
+def buildRouteMaster(instance):
+    # Set-partitioning master with the route depot -> i -> depot of every customer
+    depot = int(instance.depots[0])
+    master = Model('CVRP')
+    master.setParam("OutputFlag", 0)
+    master.modelSense = GRB.MINIMIZE
+    x = {}
+    customers = {} # Place Constraints in dictionary
+    master._routes = {}
+    for i in range(instance.n):
+        if i == depot:
+            continue
+        route = [depot, i, depot]
+        x[i] = master.addVar(vtype=GRB.CONTINUOUS, obj=routeCost(instance.distance, route), name="x_{}".format(i))
+        master._routes[i] = route
+    master.update()
+    for i in x:
+        customers[i] = master.addConstr(x[i] == 1, name="visit_{}".format(i))
+    master._nextColumn = instance.n
+    master.update()
+    return master, x, customers
+
+def addRoute(master, x, customers, route, cost):
+    # The coefficient of a customer is its number of visits (ng-routes may revisit)
+    key = master._nextColumn
+    master._nextColumn += 1
+    visits = {}
+    for i in route:
+        if i in customers:
+            visits[i] = visits.get(i, 0) + 1
+    x[key] = master.addVar(vtype=GRB.CONTINUOUS, obj=cost, name="x_{}".format(key),
+                           column=Column(list(visits.values()), [customers[i] for i in visits]))
+    master._routes[key] = list(route)
+    return x[key]
+
+def printRoutes(master, x):
+    print("-----------")
+    print("Distance: {}".format(master.objval))
+    for i in x:
+        if x[i].X > 1e-6:
+            print("{} = {:.4f}: {}".format(x[i].VarName, x[i].X, master._routes[i]))
+    print("-----------")
+
+def routeGeneration(master, x, customers, pricer, distance, verbose=True, columns=10):
+    # Add up to `columns` routes with negative reduced cost per master solve until there are none.
+    # Returns the number of master solves and the time spent in the master and in pricing
+    n = len(distance)
+    iterations = 0
+    masterTime = 0.0
+    pricingTime = 0.0
+    while True:
+        start = time.time()
+        master.optimize()
+        masterTime += time.time() - start
+        iterations += 1
+        pi = [customers[i].Pi if i in customers else 0 for i in range(n)]
+
+        start = time.time()
+        routes = pricer.price(pi, columns)
+        pricingTime += time.time() - start
+        if verbose:
+            print("Iteration {}: master {:.4f}, {} routes, best reduced cost {:.4f}".format(
+                iterations, master.objval, len(routes), routes[0][0] if routes else 0))
+        if not routes:
+            break
+        for reducedCost, route in routes:
+            addRoute(master, x, customers, route, routeCost(distance, route))
+    return iterations, masterTime, pricingTime
+
+def solveIntegerRoutes(master, x, verbose=True):
+    # Solve the restricted master with binary route variables
+    master.setParam("OutputFlag", 1 if verbose else 0)
+    for i in x:
+        x[i].vtype = GRB.BINARY
+    master.update()
+    master.optimize()
@@ -0,0 +1,152 @@
+import numpy as np
+
+EPS = 1e-9
+SHAPES = [round(0.4 + 0.1 * k, 1) for k in range(17)] # Savings shape parameters 0.4, 0.5, ..., 2.0
+
+
+def routeLength(route, distance):
+    route = np.asarray(route)
+    return distance[route[:-1], route[1:]].sum()
+
+def totalLength(routes, distance):
+    return sum(routeLength(route, distance) for route in routes)
+
+def clarkeWright(distance, demand, capacity, depot=0, shape=1.0):
+    # Parallel savings: start with one route per customer and merge route ends in order
+    # of decreasing saving s_ij = d_0i + d_0j - shape * d_ij while the load fits
+    distance = np.asarray(distance, dtype=float)
+    n = len(distance)
+    customers = np.array([i for i in range(n) if i != depot])
+    I, J = np.triu_indices(len(customers), 1)
+    I, J = customers[I], customers[J]
+    saving = distance[depot, I] + distance[depot, J] - shape * distance[I, J]
+    order = np.argsort(-saving, kind='stable')
+    order = order[saving[order] > EPS]
+
+    route = {i: [i] for i in customers.tolist()} # route of every customer (without the depot)
+    load = {id(route[i]): int(demand[i]) for i in customers.tolist()}
+    for i, j in zip(I[order].tolist(), J[order].tolist()):
+        a, b = route[i], route[j]
+        if a is b or load[id(a)] + load[id(b)] > capacity:
+            continue
+        # i and j must be route ends, turn the routes so that i ends a and j starts b
+        if a[-1] != i:
+            if a[0] != i:
+                continue
+            a.reverse()
+        if b[0] != j:
+            if b[-1] != j:
+                continue
+            b.reverse()
+        a.extend(b)
+        load[id(a)] += load.pop(id(b))
+        for k in b:
+            route[k] = a
+    routes = []
+    seen = set()
+    for i in customers.tolist():
+        if id(route[i]) not in seen:
+            seen.add(id(route[i]))
+            routes.append([depot] + route[i] + [depot])
+    return routes
+
+def twoOpt(route, distance):
+    # Reverse route[i:j+1] while that shortens the route
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(route) - 2):
+            for j in range(i + 1, len(route) - 1):
+                delta = (distance[route[i-1], route[j]] + distance[route[i], route[j+1]]
+                         - distance[route[i-1], route[i]] - distance[route[j], route[j+1]])
+                if delta < -EPS:
+                    route[i:j+1] = route[i:j+1][::-1]
+                    improved = True
+    return route
+
+def relocate(routes, loads, distance, demand, capacity):
+    # Move one customer to its best position in another route, True if a move was made
+    for a in range(len(routes)):
+        A = routes[a]
+        for p in range(1, len(A) - 1):
+            u = A[p]
+            removal = distance[A[p-1], u] + distance[u, A[p+1]] - distance[A[p-1], A[p+1]]
+            for b in range(len(routes)):
+                B = routes[b]
+                if b == a or loads[b] + demand[u] > capacity:
+                    continue
+                for q in range(len(B) - 1):
+                    insertion = distance[B[q], u] + distance[u, B[q+1]] - distance[B[q], B[q+1]]
+                    if insertion - removal < -EPS:
+                        B.insert(q + 1, A.pop(p))
+                        loads[a] -= demand[u]
+                        loads[b] += demand[u]
+                        return True
+    return False
+
+def swap(routes, loads, distance, demand, capacity):
+    # Exchange two customers of different routes, True if a move was made
+    for a in range(len(routes)):
+        A = routes[a]
+        for p in range(1, len(A) - 1):
+            u = A[p]
+            for b in range(a + 1, len(routes)):
+                B = routes[b]
+                for q in range(1, len(B) - 1):
+                    v = B[q]
+                    if loads[a] - demand[u] + demand[v] > capacity or loads[b] - demand[v] + demand[u] > capacity:
+                        continue
+                    delta = (distance[A[p-1], v] + distance[v, A[p+1]] + distance[B[q-1], u] + distance[u, B[q+1]]
+                             - distance[A[p-1], u] - distance[u, A[p+1]] - distance[B[q-1], v] - distance[v, B[q+1]])
+                    if delta < -EPS:
+                        A[p], B[q] = v, u
+                        loads[a] += demand[v] - demand[u]
+                        loads[b] += demand[u] - demand[v]
+                        return True
+    return False
+
+def twoOptStar(routes, loads, distance, demand, capacity):
+    # Exchange the tails of two routes after edges (A[p], A[p+1]) and (B[q], B[q+1]),
+    # True if a move was made
+    prefix = [np.cumsum([demand[i] for i in route]) for route in routes]
+    for a in range(len(routes)):
+        A = routes[a]
+        for b in range(a + 1, len(routes)):
+            B = routes[b]
+            for p in range(len(A) - 1):
+                for q in range(len(B) - 1):
+                    if prefix[a][p] + loads[b] - prefix[b][q] > capacity or prefix[b][q] + loads[a] - prefix[a][p] > capacity:
+                        continue
+                    delta = (distance[A[p], B[q+1]] + distance[B[q], A[p+1]]
+                             - distance[A[p], A[p+1]] - distance[B[q], B[q+1]])
+                    if delta < -EPS:
+                        routes[a], routes[b] = A[:p+1] + B[q+1:], B[:q+1] + A[p+1:]
+                        loads[a], loads[b] = prefix[a][p] + loads[b] - prefix[b][q], prefix[b][q] + loads[a] - prefix[a][p]
+                        return True
+    return False
+
+def localSearch(routes, distance, demand, capacity):
+    # 2-opt inside routes, then relocate, swap and 2-opt* between routes until none improves
+    distance = np.asarray(distance, dtype=float)
+    demand = [int(d) for d in demand]
+    routes = [twoOpt(list(route), distance) for route in routes]
+    loads = [sum(demand[i] for i in route) for route in routes]
+    while relocate(routes, loads, distance, demand, capacity) or swap(routes, loads, distance, demand, capacity) \
+            or twoOptStar(routes, loads, distance, demand, capacity):
+        routes = [twoOpt(route, distance) for route in routes]
+    return [route for route in routes if len(route) > 2]
+
+def savingsRoutes(instance, shapes=SHAPES):
+    # Clarke-Wright routes improved by local search, the best solution over the shape
+    # parameters and the routes of every solution (distinct, as initial columns)
+    depot = int(instance.depots[0])
+    best = None
+    pool = {}
+    for shape in shapes:
+        routes = clarkeWright(instance.distance, instance.demand, instance.capacity, depot, shape)
+        routes = localSearch(routes, instance.distance, instance.demand, instance.capacity)
+        if best is None or totalLength(routes, instance.distance) < totalLength(best, instance.distance):
+            best = routes
+        for route in routes:
+            pool.setdefault(min(tuple(route), tuple(route[::-1])), route)
+    return best, list(pool.values())
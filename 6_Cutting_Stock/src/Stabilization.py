@@ -0,0 +1,104 @@
+from gurobipy import *
+
+
+class Stabilization:
+    # No stabilization: price at the duals of the restricted master
+
+    name = 'none'
+
+    def setup(self, master, orders):
+        pass
+
+    def candidates(self, pi):
+        # Dual vectors to price at, in order, until one gives a column that prices out at pi
+        return [pi]
+
+    def feedback(self, pi, bound):
+        # Lagrangian bound obtained when pricing at pi
+        pass
+
+    def converged(self, master, pi):
+        # Called when no column prices out at pi, True if the master LP is optimal
+        return True
+
+    def exact(self, master):
+        # True if the master objective is a valid bound for the LP (no artificial columns in use)
+        return True
+
+    def teardown(self, master):
+        pass
+
+
+class Wentges(Stabilization):
+    # Dual smoothing: price at alpha * center + (1 - alpha) * pi, where the center is
+    # the dual vector with the best Lagrangian bound so far. On a mispricing the
+    # smoothed point moves towards pi (alpha^2, alpha^3, ...) and ends at pi itself
+
+    name = 'wentges'
+
+    def __init__(self, alpha=0.8, steps=5):
+        self.alpha = alpha
+        self.steps = steps
+        self.center = None
+        self.bound = -GRB.INFINITY
+
+    def candidates(self, pi):
+        if self.center is None:
+            return [pi]
+        weights = [self.alpha**k for k in range(1, self.steps + 1)] + [0]
+        return [[a * c + (1 - a) * p for c, p in zip(self.center, pi)] for a in weights]
+
+    def feedback(self, pi, bound):
+        if bound > self.bound:
+            self.bound = bound
+            self.center = list(pi)
+
+
+class Boxstep(Stabilization):
+    # Duals restricted to [center - delta, center + delta] through artificial columns
+    # (+1 with cost center + delta, -1 with cost center - delta in every row). Once no
+    # column prices out, the box is moved to the current duals unless the artificial
+    # columns are all zero, in which case the box was not binding and the LP is optimal
+
+    name = 'boxstep'
+
+    def __init__(self, delta=0.05):
+        self.delta = delta
+
+    def setup(self, master, orders):
+        self.orders = orders
+        self.above = {}
+        self.below = {}
+        for j in orders:
+            self.above[j] = master.addVar(obj=0, column=Column([1], [orders[j]]), name="box_above_{}".format(j))
+            self.below[j] = master.addVar(obj=0, column=Column([-1], [orders[j]]), name="box_below_{}".format(j))
+        self.recenter([0] * len(orders))
+
+    def recenter(self, center):
+        for j in self.orders:
+            self.above[j].Obj = center[j] + self.delta
+            self.below[j].Obj = -max(center[j] - self.delta, 0)
+
+    def exact(self, master):
+        return all(v.X < 1e-9 for v in list(self.above.values()) + list(self.below.values()))
+
+    def converged(self, master, pi):
+        if self.exact(master):
+            return True
+        self.recenter(pi)
+        return False
+
+    def teardown(self, master):
+        for v in list(self.above.values()) + list(self.below.values()):
+            master.remove(v)
+        master.update()
+
+
+def makeStabilization(method):
+    if method == 'none':
+        return Stabilization()
+    if method == 'wentges':
+        return Wentges()
+    if method == 'boxstep':
+        return Boxstep()
+    raise ValueError("Unknown stabilization: {}".format(method))
@@ -0,0 +1,87 @@
+import numpy as np
+import os
+import re
+
+
+class CVRP:
+    # A TSPLIB CVRP instance with 0-based node numbers. optimum and trucks come from
+    # the COMMENT line (None when it does not give them)
+
+    def __init__(self, name, capacity, location, demand, depots, distance, optimum=None, trucks=None):
+        self.name = name
+        self.capacity = capacity
+        self.location = location
+        self.demand = demand
+        self.depots = depots
+        self.distance = distance
+        self.optimum = optimum
+        self.trucks = trucks
+        self.n = len(location)
+
+
+def calcDistance(location, weightType='EUC_2D'):
+    # EUC_2D distances are rounded to the nearest integer, CEIL_2D ones rounded up
+    location = np.asarray(location, dtype=float)
+    distance = np.hypot(location[:, None, 0] - location[None, :, 0], location[:, None, 1] - location[None, :, 1])
+    if weightType == 'EUC_2D':
+        return np.floor(distance + 0.5)
+    if weightType == 'CEIL_2D':
+        return np.ceil(distance)
+    raise ValueError("Unsupported EDGE_WEIGHT_TYPE: {}".format(weightType))
+
+def parseComment(comment):
+    optimum = re.search(r'(?:Optimal|Best) value:\s*(\d+)', comment)
+    trucks = re.search(r'trucks:\s*(\d+)', comment)
+    return (int(optimum.group(1)) if optimum else None), (int(trucks.group(1)) if trucks else None)
+
+def readSection(f):
+    # Numbers up to the next keyword line, parsed in one call
+    lines = []
+    for line in f:
+        if line[:1].isalpha():
+            return np.fromstring(' '.join(lines), sep=' '), line
+        lines.append(line)
+    return np.fromstring(' '.join(lines), sep=' '), ''
+
+def readVRP(inputfile, cache=True):
+    # Read a TSPLIB .vrp file. The parsed instance and its distance matrix are cached
+    # next to the input as a .npz file
+    cacheFile = inputfile + '.npz'
+    if cache and os.path.exists(cacheFile) and os.path.getmtime(cacheFile) >= os.path.getmtime(inputfile):
+        data = np.load(cacheFile)
+        optimum, trucks = int(data['optimum']), int(data['trucks'])
+        return CVRP(str(data['name']), int(data['capacity']), data['location'], data['demand'], data['depots'],
+                    data['distance'], None if optimum < 0 else optimum, None if trucks < 0 else trucks)
+
+    header = {}
+    location = demand = depots = None
+    f = open(inputfile, 'r')
+    line = f.readline()
+    while line:
+        keyword = line.split(':')[0].strip()
+        if keyword == 'NODE_COORD_SECTION':
+            values, line = readSection(f)
+            location = values.reshape(-1, 3)[:, 1:]
+        elif keyword == 'DEMAND_SECTION':
+            values, line = readSection(f)
+            demand = values.reshape(-1, 2)[:, 1].astype(np.int64)
+        elif keyword == 'DEPOT_SECTION':
+            values, line = readSection(f)
+            depots = values[values >= 0].astype(np.int64) - 1
+        else:
+            if ':' in line:
+                header[keyword] = line.split(':', 1)[1].strip()
+            line = f.readline()
+    f.close()
+
+    optimum, trucks = parseComment(header.get('COMMENT', ''))
+    if depots is None:
+        depots = np.zeros(1, dtype=np.int64)
+    distance = calcDistance(location, header.get('EDGE_WEIGHT_TYPE', 'EUC_2D'))
+    instance = CVRP(header.get('NAME', os.path.basename(inputfile)), int(header['CAPACITY']), location, demand, depots,
+                    distance, optimum, trucks)
+    if cache:
+        np.savez(cacheFile, name=instance.name, capacity=instance.capacity, location=location, demand=demand,
+                 depots=depots, distance=distance, optimum=-1 if optimum is None else optimum,
+                 trucks=-1 if trucks is None else trucks)
+    return instance
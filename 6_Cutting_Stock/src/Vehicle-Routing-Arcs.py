@@ -0,0 +1,33 @@
+from gurobipy import *
+from CVRPModel import *
+from RoutingHeuristics import *
+from VRPReader import *
+
+# Two-index CVRP with rounded capacity inequalities separated in the callback,
+# lazy on integer solutions and user cuts on fractional ones
+
+INSTANCES = ["../dat/A-n33-k5.vrp", "../dat/A-n37-k6.vrp", "../dat/A-n45-k7.vrp"]
+TIME_LIMIT = 120
+WARM_START = True # MIP start from Clarke-Wright savings and local search
+
+results = []
+for inputfile in INSTANCES:
+    instance = readVRP(inputfile)
+    model = buildCVRP(instance)
+    model.Params.TimeLimit = TIME_LIMIT
+    if WARM_START:
+        setStart(model, savingsRoutes(instance)[0])
+    model.optimize(capacityCuts)
+    # The time limit can hit before an incumbent exists or before the root node is reported
+    found = float('nan')
+    if model.SolCount > 0:
+        found = model.objVal
+        for route in routes(model):
+            print("Route with load {}: {}".format(instance.demand[route].sum(), route))
+    rootBound = model._rootBound if model._rootBound is not None else float('nan')
+    rootGap = 100.0 * (instance.optimum - rootBound) / instance.optimum if instance.optimum else float('nan')
+    results.append([instance.name, instance.optimum if instance.optimum else float('nan'), rootBound, rootGap, found, model._cuts, model._separationTime, model.Runtime])
+
+print('{:<12}{:>10}{:>12}{:>12}{:>10}{:>8}{:>12}{:>10}'.format('Instance', 'Optimum', 'Root bound', 'Root gap %', 'Found', 'Cuts', 'Sep. (s)', 'Total (s)'))
+for row in results:
+    print('{:<12}{:>10}{:>12.2f}{:>12.2f}{:>10.0f}{:>8}{:>12.3f}{:>10.2f}'.format(*row))
@@ -0,0 +1,28 @@
+from gurobipy import *
+from ESPPRC import *
+from RouteGeneration import *
+from RoutingHeuristics import *
+from VRPReader import *
+
+INSTANCE = "../dat/A-n33-k5.vrp"
+NG = 8 # ng-neighborhood size of the labeling pricer
+COLUMNS = 10 # Routes added per master solve
+WARM_START = True # Start the master with the routes of Clarke-Wright savings and local search
+
+instance = readVRP(INSTANCE)
+master, x, customers = buildRouteMaster(instance)
+if WARM_START:
+    best, start = savingsRoutes(instance)
+    print("Savings and local search: distance {:.0f}, {} initial routes".format(totalLength(best, instance.distance), len(start)))
+    for route in start:
+        addRoute(master, x, customers, route, routeCost(instance.distance, route))
+pricer = LabelingPricer(instance.distance, instance.demand, instance.capacity, NG, int(instance.depots[0]))
+
+iterations, masterTime, pricingTime = routeGeneration(master, x, customers, pricer, instance.distance, columns=COLUMNS)
+bound = master.objval
+print("{} master solves, master {:.3f}s, pricing {:.3f}s".format(iterations, masterTime, pricingTime))
+pricer.printStatistics()
+printRoutes(master, x)
+
+solveIntegerRoutes(master, x)
+print("LP bound {:.2f}, restricted master IP {:.0f}, optimum {}".format(bound, master.objval, instance.optimum))